@@ -0,0 +1,3 @@
+# Panteão: importar o pacote não carrega nada. O jogo começa por
+# launcher.main (comando `panteao` ou python -m panteão); as ferramentas sem
+# janela rodam como python -m panteão.bench, .balance, .replay e .assets.
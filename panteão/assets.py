@@ -0,0 +1,112 @@
+import json
+import os
+import sys
+import time
+import wave
+from pathlib import Path
+
+from .audio import SOUND_DIR, SOUND_NAMES, SOUND_EXTENSIONS, MANIFEST_NAME, MANIFEST_VERSION, file_checksum, read_manifest
+
+# Build dos assets de áudio.
+# Procura cada som (e a música) pelas extensões conhecidas uma vez, aqui, e
+# grava sounds/manifest.json com nome -> arquivo, duração e checksum. Cada
+# som também é decodificado para um WAV em sounds/cache/, já no formato em que
+# o pgzero abre o mixer, para o jogo carregar sem decodificar MP3 na partida:
+#
+#   python -m panteão.assets
+#
+# Sons que não mudaram desde o último build não são decodificados de novo. A
+# música não vai para o cache: o pygame.mixer.music lê ela aos poucos
+# durante o jogo.
+
+CACHE_DIR = "cache"
+# Formato do mixer que o pgzero usa (pgzero.runner: pre_init(22050, -16, 2))
+MIXER_FREQUENCY = 22050
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+
+def find_source(sound_dir, name):
+    for ext in SOUND_EXTENSIONS:
+        path = sound_dir / f"{name}{ext}"
+        if path.exists():
+            return path
+    return None
+
+def source_entry(path):
+    stat = path.stat()
+    return {
+        "file": path.name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha1": file_checksum(path),
+    }
+
+def write_wav(path, sound):
+    # Amostras cruas do mixer (inteiros de 16 bits intercalados por canal)
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(MIXER_CHANNELS)
+        f.setsampwidth(abs(MIXER_SIZE) // 8)
+        f.setframerate(MIXER_FREQUENCY)
+        f.writeframes(sound.get_raw())
+
+def build(sound_dir=SOUND_DIR, names=SOUND_NAMES):
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    pygame.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS)
+    pygame.mixer.init()
+    
+    sound_dir = Path(sound_dir)
+    cache_dir = sound_dir / CACHE_DIR
+    cache_dir.mkdir(exist_ok=True)
+    previous = read_manifest(sound_dir) or {"sounds": {}}
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "mixer": [MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS],
+        "sounds": {},
+        "music": None,
+    }
+    missing = []
+    
+    for name in names:
+        path = find_source(sound_dir, name)
+        if path is None:
+            missing.append(name)
+            continue
+        entry = source_entry(path)
+        cache = f"{CACHE_DIR}/{name}.wav"
+        old = previous["sounds"].get(name)
+        if old and old["sha1"] == entry["sha1"] and old.get("cache") == cache and (sound_dir / cache).exists():
+            entry["duration"] = old["duration"]
+            status = "sem mudança"
+        else:
+            start = time.perf_counter()
+            sound = pygame.mixer.Sound(str(path))
+            write_wav(sound_dir / cache, sound)
+            entry["duration"] = round(sound.get_length(), 3)
+            status = f"decodificado em {(time.perf_counter() - start) * 1000:.1f}ms"
+        entry["cache"] = cache
+        manifest["sounds"][name] = entry
+        print(f"{name:12s} {entry['file']:16s} {entry['duration']:6.2f}s  {status}")
+    
+    music = find_source(sound_dir, "music")
+    if music:
+        manifest["music"] = music.name
+    else:
+        missing.append("music")
+    
+    with open(sound_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    if missing:
+        print(f"Arquivos de áudio faltando: {missing}")
+    print(f"Manifesto salvo em {sound_dir / MANIFEST_NAME}")
+    return manifest
+
+def main(argv):
+    if len(argv) > 1:
+        print("Uso: python -m panteão.assets [pasta_dos_sons]")
+        return 2
+    build(argv[0] if argv else SOUND_DIR)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
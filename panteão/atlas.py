@@ -0,0 +1,94 @@
+import pygame
+from pgzero.screen import Screen
+
+# Atlas de sprites do Panteão.
+# Cada visual distinto de uma entidade (inimigo por cor, tamanho e direção,
+# cada quadro do pulso do orbe, porta, tiro, chicote, barras de vida) é
+# rasterizado uma única vez, na primeira vez que aparece, num pedaço de uma
+# superfície grande (página do atlas). Depois a entidade é só um blit desse
+# pedaço, e SpriteBatch junta os blits do frame numa chamada Surface.blits.
+#
+# Um sprite é identificado pela função que o pinta e pelos argumentos dela:
+# sprite(largura, altura, pintar, *args) chama pintar(Screen, *args) numa
+# subsuperfície transparente de largura x altura só da primeira vez.
+
+PAGE_SIZE = 1024
+# Espaço entre sprites na página, para um não vazar no outro
+PADDING = 1
+
+class SpriteAtlas:
+    def __init__(self, page_size=PAGE_SIZE):
+        self.page_size = page_size
+        self.pages = []
+        # chave -> (página, área)
+        self.sprites = {}
+        # Empacotamento em prateleiras: posição livre na página atual e
+        # altura da prateleira atual
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+    
+    def __len__(self):
+        return len(self.sprites)
+    
+    def new_page(self):
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        if pygame.display.get_surface():
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+        return page
+    
+    def allocate(self, width, height):
+        if width > self.page_size or height > self.page_size:
+            raise ValueError(f"Sprite {width}x{height} não cabe numa página do atlas")
+        if not self.pages:
+            self.new_page()
+        if self.shelf_x + width > self.page_size:
+            # Próxima prateleira
+            self.shelf_x = 0
+            self.shelf_y += self.shelf_height + PADDING
+            self.shelf_height = 0
+        if self.shelf_y + height > self.page_size:
+            self.new_page()
+        area = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+        self.shelf_x += width + PADDING
+        self.shelf_height = max(self.shelf_height, height)
+        return self.pages[-1], area
+    
+    def sprite(self, width, height, paint, *args):
+        key = (paint,) + args
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            page, area = self.allocate(width, height)
+            paint(Screen(page.subsurface(area)), *args)
+            sprite = (page, area)
+            self.sprites[key] = sprite
+        return sprite
+    
+    def clear(self):
+        self.pages = []
+        self.sprites.clear()
+
+class SpriteBatch:
+    # Blits acumulados na ordem de desenho; flush() manda todos de uma vez.
+    # add() recebe coordenadas do nível; offset é a posição da câmera.
+    def __init__(self):
+        self.items = []
+        self.offset_x = 0
+        self.offset_y = 0
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def add(self, sprite, x, y):
+        page, area = sprite
+        self.items.append((page, (x - self.offset_x, y - self.offset_y), area))
+    
+    def flush(self, target):
+        if self.items:
+            target.surface.blits(self.items, doreturn=False)
+            self.items.clear()
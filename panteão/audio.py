@@ -0,0 +1,142 @@
+import hashlib
+import json
+from pathlib import Path
+
+# Registro de sons do Panteão.
+# Resolve cada nome de som para o objeto carregado uma única vez (em load) e
+# depois só faz consultas em dicionário: nada de Path.exists nem getattr no
+# loader a cada play. Não importa pgzero; o loader `sounds` é passado em load.
+#
+# Com o manifesto gerado pelo assets.py (sounds/manifest.json), load não
+# procura arquivo nenhum: cada nome já vem com o arquivo e a versão em WAV
+# decodificada no formato do mixer (sounds/cache/), que carrega sem
+# decodificar MP3. Um som cujo arquivo mudou depois do manifesto (tamanho,
+# data ou checksum diferentes) volta a ser carregado do original.
+
+# Pasta dos sons ao lado do código, não do diretório de onde o jogo foi aberto
+SOUND_DIR = Path(__file__).resolve().parent / "sounds"
+
+SOUND_NAMES = ['ability', 'attack', 'collect', 'door', 'enemy_hurt', 'hurt', 'jump', 'select', 'shield']
+SOUND_EXTENSIONS = ['.wav', '.mp3', '.ogg']
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+def file_checksum(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def read_manifest(sound_dir):
+    # Manifesto do assets.py, ou None se não houver (ou for de outra versão)
+    try:
+        with open(Path(sound_dir) / MANIFEST_NAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+def source_unchanged(sound_dir, entry):
+    # Tamanho e data batem: nem precisa ler o arquivo
+    try:
+        stat = (Path(sound_dir) / entry["file"]).stat()
+    except OSError:
+        return False
+    if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+        return True
+    # Data diferente (um checkout, por exemplo) com o mesmo conteúdo
+    return stat.st_size == entry["size"] and file_checksum(Path(sound_dir) / entry["file"]) == entry["sha1"]
+
+# Canal de cada som; sons fora da tabela vão para "sfx"
+SOUND_CHANNELS = {
+    'select': 'ui',
+}
+
+# Volume de cada canal, multiplicado pelo volume pedido em play; a música de
+# fundo usa o canal "music" (main.load_music)
+CHANNEL_VOLUMES = {"sfx": 1.0, "ui": 1.0, "music": 0.9}
+
+# Quantos frames um som precisa esperar até poder tocar de novo.
+# O padrão (1) só impede o mesmo som duas vezes no mesmo frame.
+SOUND_COOLDOWNS = {
+    'hurt': 6,
+    'enemy_hurt': 4,
+}
+
+class SoundRegistry:
+    def __init__(self, sound_dir=SOUND_DIR):
+        self.sound_dir = Path(sound_dir)
+        self.sounds = {}
+        self.missing = []
+        self.music_file = None
+        self.enabled = True
+        self.frame = 0
+        self.last_played = {}
+    
+    def load(self, loader, names=SOUND_NAMES):
+        self.sounds = {}
+        self.missing = []
+        manifest = read_manifest(self.sound_dir)
+        entries = manifest["sounds"] if manifest else {}
+        
+        for name in names:
+            entry = entries.get(name)
+            filename = self.manifest_file(entry) if entry else self.find(name)
+            if filename:
+                try:
+                    self.sounds[name] = loader.load(filename)
+                except Exception as e:
+                    print(f"Erro ao carregar som {name}: {e}")
+            if name not in self.sounds:
+                self.missing.append(name)
+        
+        if manifest:
+            self.music_file = manifest.get("music")
+        else:
+            self.music_file = self.find("music")
+        if self.music_file is None:
+            self.missing.append('music')
+        
+        if self.missing:
+            print(f"Arquivos de áudio faltando: {self.missing}")
+        return not self.missing
+    
+    def find(self, name):
+        # Sem manifesto: procura o arquivo pelas extensões conhecidas
+        for ext in SOUND_EXTENSIONS:
+            if (self.sound_dir / f"{name}{ext}").exists():
+                return f"{name}{ext}"
+        return None
+    
+    def manifest_file(self, entry):
+        # WAV pré-decodificado quando ele existe e o original não mudou
+        cache = entry.get("cache")
+        if cache and (self.sound_dir / cache).exists() and source_unchanged(self.sound_dir, entry):
+            return cache
+        return entry["file"]
+    
+    def next_frame(self):
+        self.frame += 1
+    
+    def play(self, sound_name, volume=1.0):
+        if not self.enabled:
+            return False
+        
+        sound = self.sounds.get(sound_name)
+        if sound is None:
+            return False
+        
+        last = self.last_played.get(sound_name)
+        if last is not None and self.frame - last < SOUND_COOLDOWNS.get(sound_name, 1):
+            return False
+        self.last_played[sound_name] = self.frame
+        
+        channel = SOUND_CHANNELS.get(sound_name, "sfx")
+        try:
+            sound.set_volume(volume * CHANNEL_VOLUMES.get(channel, 1.0))
+            sound.play()
+            return True
+        except Exception as e:
+            print(f"Erro ao tocar som {sound_name}: {e}")
+            return False
@@ -0,0 +1,344 @@
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .world import World
+
+# Simulação em lote para balanceamento.
+# Joga cada nível muitas vezes sem janela, com um agente roteirizado ou
+# aleatório, e junta por nível a taxa de sobrevivência, o tempo até a porta,
+# o dano tomado e a velocidade da simulação num CSV. Cada partida é um
+# World próprio com a sua semente, rodado num processo do pool:
+#
+#   python -m panteão.balance --runs 200 --policy door --policy random --output balance.csv
+#
+# Uma partida termina quando o jogador chega na porta, morre ou passa de
+# --max-ticks. Sobrevive quem não morreu, saindo pela porta ou não; a
+# partida que passa de --max-ticks também conta à parte (timeout_rate), já que
+# o agente não chegou na porta. Os números servem para acertar os atributos do
+# Enemy e os custos de Player.use_ability; a partida em si é a mesma do jogo.
+
+# Os 10 níveis do jogo (World.max_level)
+LEVELS = range(1, 11)
+
+# Um agente decide os comandos do tick a cada DECISION_TICKS ticks
+DECISION_TICKS = 10
+# Quanto o pulo do jogador sobe, com folga (jump_power -15, gravidade 0.8)
+JUMP_REACH = 130
+# Distância em que o agente roteirizado levanta o escudo
+THREAT_DISTANCE = 80
+
+COLUMNS = ["level", "policy", "runs", "survival_rate", "door_rate", "timeout_rate", "mean_ticks_to_door",
+           "mean_seconds_to_door", "mean_damage_taken", "ticks_per_second"]
+
+class DoorPolicy:
+    # Vai atrás do orbe de habilidade (se ainda não tiver uma) e depois da
+    # porta, atacando o tempo todo, com escudo perto dos inimigos e a
+    # habilidade sempre que der.
+    # Para subir escolhe a plataforma alcançável mais alta (step_up), anda até
+    # a borda dela, do lado de fora, pula parado e só entra na plataforma
+    # depois do topo do pulo. Pulando embaixo dela o jogador bate a cabeça, e o
+    # pulo correndo não cruza o vão entre as colunas do zigue-zague; quando o
+    # lugar do pulo fica fora da plataforma em que está, ele sai pela borda e
+    # pula ainda caindo.
+    def __init__(self, rng):
+        self.rng = rng
+        self.direction = None
+        self.last_x = None
+        self.goal_x = 0
+        # Plataforma do pulo em andamento (None fora de um pulo de subida)
+        self.climb = None
+        # Altura dos pés na última decisão com o jogador parado em pé
+        self.floor = None
+    
+    def commands(self, world):
+        player = world.player
+        rect = player.rect
+        if world.ability_orbs and not player.collected_ability:
+            target = world.ability_orbs[0].rect
+        else:
+            target = world.door.rect
+        goal_x = target.centerx
+        jump = False
+        wander = False
+        if player.is_jumping:
+            # No ar o agente mantém o plano de quando saiu do chão
+            goal_x = self.goal_x
+            if self.climb:
+                # Pulo parado: espera o topo do pulo para entrar na plataforma;
+                # pulo correndo: segue até ela
+                goal_x = self.climb.centerx
+                if player.velocity_y < 0 and self.gap(rect, self.climb) <= player.speed * DECISION_TICKS:
+                    goal_x = rect.centerx
+        else:
+            self.climb = None
+            stride = player.speed * DECISION_TICKS
+            if not player.velocity_y or self.floor is None:
+                self.floor = rect.bottom
+            climb = None
+            if target.bottom < rect.top and not self.in_reach(world, player, target):
+                # Caindo pela borda, o alcance ainda conta da plataforma de onde saiu
+                climb = self.step_up(world, player, self.floor if player.velocity_y > 0 else rect.bottom)
+            if climb:
+                goal_x = self.launch_x(world, player, climb, stride)
+                if goal_x is None:
+                    # Já está do lado da plataforma
+                    self.climb = climb
+                    goal_x = rect.centerx
+                    jump = True
+                elif player.velocity_y > 0 and self.gap(rect, climb) <= 4 * stride:
+                    # Acabou de sair pela borda de uma plataforma (ainda dá para
+                    # pular) com climb do outro lado do vão: pula correndo
+                    self.climb = climb
+                    goal_x = climb.centerx
+                    jump = True
+            elif target.bottom < rect.top:
+                # Alvo solto no ar ao alcance do pulo (porta do nível 1)
+                jump = abs(target.centerx - rect.centerx) <= stride // 2
+            else:
+                wander = True
+                if target.top >= rect.bottom and self.gap(rect, target) == 0 and self.direction in ("left", "right"):
+                    # Alvo logo abaixo: segue até sair da plataforma, em vez de
+                    # ir e voltar em cima dele
+                    goal_x = rect.centerx + (1 if self.direction == "right" else -1)
+        self.goal_x = goal_x
+        commands = []
+        if goal_x == rect.centerx:
+            direction = "stop"
+        else:
+            direction = "right" if goal_x > rect.centerx else "left"
+        if direction != self.direction:
+            commands.append(direction)
+            self.direction = direction
+        if wander:
+            # Andando no mesmo nível do alvo: pula quando fica preso e de vez
+            # em quando, para passar por cima dos inimigos
+            stuck = self.last_x is not None and abs(rect.x - self.last_x) < 1
+            jump = not self.ceiling(world, player) and (stuck or self.rng.random() < 0.2)
+        if jump:
+            commands.append("jump")
+        self.last_x = rect.x
+        commands.append("attack")
+        # Escudo enquanto houver inimigo encostando
+        if self.threatened(world, player):
+            commands.append("shield")
+        elif player.shielding:
+            commands.append("stop_shield")
+        if player.collected_ability:
+            commands.append("ability")
+        return commands
+    
+    def step_up(self, world, player, floor):
+        # A plataforma mais alta ao alcance do pulo; entre as da mesma altura,
+        # a mais perto na horizontal. Subir pela mais perto fazia o agente
+        # voltar para a plataforma de onde tinha acabado de sair
+        best = None
+        best_key = None
+        for platform in world.platforms:
+            rect = platform.rect
+            if floor - JUMP_REACH <= rect.top < player.rect.top:
+                key = (rect.top, self.gap(player.rect, rect))
+                if best is None or key < best_key:
+                    best = rect
+                    best_key = key
+        return best
+    
+    def launch_x(self, world, player, climb, stride):
+        # Centro do lugar de onde pular para climb, logo fora de uma das bordas
+        # (o jogador inteiro fora dela, a menos de um passo entre decisões).
+        # None se o jogador já está num desses lugares.
+        # O jogador anda de stride em stride entre uma decisão e outra; entre
+        # os dois lados vale o que ele alcança sem passar muito da borda da
+        # plataforma em que está (caindo perde altura para o pulo) e depois o
+        # que ele alcança em menos decisões
+        rect = player.rect
+        width, height = world.bounds
+        floor = self.floor_under(world, rect)
+        best = None
+        best_key = None
+        for low, high in ((climb.left - stride - rect.w, climb.left - rect.w),
+                          (climb.right, climb.right + stride)):
+            if low < 0 or high + rect.w > width:
+                continue
+            if low <= rect.x <= high:
+                return None
+            step = stride if low > rect.x else -stride
+            x = rect.x
+            steps = 0
+            while not low <= x <= high and steps < width // stride + 1:
+                x += step
+                steps += 1
+            overhang = 0
+            if floor:
+                overhang = max(floor.left - (x + rect.w), x - floor.right, 0)
+            key = (overhang > stride // 2, steps)
+            if best is None or key < best_key:
+                best = (low + high) / 2 + rect.w / 2
+                best_key = key
+        return climb.centerx if best is None else best
+    
+    def floor_under(self, world, player_rect):
+        # Plataforma em que o jogador está em pé (None no ar)
+        for platform in world.platforms:
+            rect = platform.rect
+            if rect.top == player_rect.bottom and rect.left < player_rect.right and rect.right > player_rect.left:
+                return rect
+        return None
+    
+    def gap(self, rect, other):
+        # Distância na horizontal entre dois rects (0 se se sobrepõem)
+        return max(other.left - rect.right, rect.left - other.right, 0)
+    
+    def in_reach(self, world, player, target):
+        # O alvo dá para tocar pulando daqui: não está alto demais e nenhuma
+        # plataforma fica entre ele e o jogador
+        rect = player.rect
+        if target.bottom < rect.bottom - JUMP_REACH:
+            return False
+        for platform in world.platforms:
+            other = platform.rect
+            if target.bottom <= other.top < rect.bottom and other.left < target.right and other.right > target.left:
+                return False
+        return True
+    
+    def threatened(self, world, player):
+        x, y = player.rect.centerx, player.rect.centery
+        for enemy in world.enemies:
+            if not enemy.necromanced and abs(enemy.rect.centerx - x) < THREAT_DISTANCE and abs(enemy.rect.centery - y) < THREAT_DISTANCE:
+                return True
+        return False
+    
+    def ceiling(self, world, player):
+        rect = player.rect
+        for platform in world.platforms:
+            other = platform.rect
+            if rect.top - JUMP_REACH < other.bottom <= rect.top and other.left < rect.right and other.right > rect.left:
+                return True
+        return False
+
+class RandomPolicy:
+    # Um comando sorteado por decisão, de um conjunto que anda mais do que para
+    CHOICES = ("left", "right", "right", "jump", "jump", "attack", "attack", "shield", "stop_shield", "ability", "stop")
+    
+    def __init__(self, rng):
+        self.rng = rng
+    
+    def commands(self, world):
+        return [self.rng.choice(self.CHOICES)]
+
+POLICIES = {
+    "door": DoorPolicy,
+    "random": RandomPolicy,
+}
+
+def play_level(level, seed, policy_name, max_ticks):
+    # Roda uma partida de um nível; chamada dentro de um processo do pool
+    world = World(level=level, seed=seed)
+    # O agente tem um RNG próprio: a partida só depende da semente e dos comandos
+    policy = POLICIES[policy_name](random.Random(seed ^ 0x5EED))
+    player = world.player
+    if world.ability_choices and not player.collected_ability:
+        # Nível do boss jogado direto: começa com uma das habilidades possíveis
+        player.collected_ability = policy.rng.choice(world.ability_choices)
+    
+    damage = 0.0
+    health = player.health
+    start = time.perf_counter()
+    while world.state == "playing" and not world.transitioning and world.ticks < max_ticks:
+        inputs = policy.commands(world) if world.ticks % DECISION_TICKS == 0 else ()
+        world.step(inputs)
+        world.pop_sound_events()
+        if world.player.health < health:
+            damage += health - world.player.health
+        health = world.player.health
+    elapsed = time.perf_counter() - start
+    
+    return {
+        "level": level,
+        "policy": policy_name,
+        "seed": seed,
+        "survived": world.state != "game_over",
+        "door": world.transitioning,
+        "timeout": world.state == "playing" and not world.transitioning,
+        "ticks": world.ticks,
+        "damage": damage,
+        "elapsed": elapsed,
+    }
+
+def play_job(job):
+    return play_level(*job)
+
+def summarize(results):
+    # Uma linha por (nível, agente)
+    groups = {}
+    for result in results:
+        groups.setdefault((result["level"], result["policy"]), []).append(result)
+    rows = []
+    for (level, policy), runs in sorted(groups.items()):
+        doors = [run["ticks"] for run in runs if run["door"]]
+        ticks = sum(run["ticks"] for run in runs)
+        elapsed = sum(run["elapsed"] for run in runs)
+        mean_door = sum(doors) / len(doors) if doors else 0.0
+        rows.append({
+            "level": level,
+            "policy": policy,
+            "runs": len(runs),
+            "survival_rate": round(sum(run["survived"] for run in runs) / len(runs), 4),
+            "door_rate": round(len(doors) / len(runs), 4),
+            "timeout_rate": round(sum(run["timeout"] for run in runs) / len(runs), 4),
+            "mean_ticks_to_door": round(mean_door, 1),
+            "mean_seconds_to_door": round(mean_door / 60, 2),
+            "mean_damage_taken": round(sum(run["damage"] for run in runs) / len(runs), 2),
+            "ticks_per_second": round(ticks / elapsed) if elapsed else 0,
+        })
+    return rows
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Simulação em lote dos níveis do Panteão para balanceamento")
+    parser.add_argument("--runs", type=int, default=50, help="partidas por nível e agente")
+    parser.add_argument("--seed", type=int, default=1234, help="semente da primeira partida")
+    parser.add_argument("--level", type=int, action="append",
+                        help="nível a rodar (pode repetir); padrão: todos")
+    parser.add_argument("--policy", action="append", choices=sorted(POLICIES),
+                        help="agente (pode repetir); padrão: door")
+    parser.add_argument("--max-ticks", type=int, default=60 * 120)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", default="balance.csv")
+    args = parser.parse_args(argv)
+    
+    levels = args.level or list(LEVELS)
+    policies = args.policy or ["door"]
+    # Uma semente diferente para cada partida de um mesmo nível e agente
+    jobs = [(level, args.seed + run, policy, args.max_ticks)
+            for level in levels for policy in policies for run in range(args.runs)]
+    
+    start = time.perf_counter()
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            results = list(executor.map(play_job, jobs, chunksize=max(1, len(jobs) // (args.workers * 4))))
+    else:
+        results = [play_job(job) for job in jobs]
+    elapsed = time.perf_counter() - start
+    
+    rows = summarize(results)
+    with open(args.output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    for row in rows:
+        print(f"nível {row['level']:2d} {row['policy']:7s} sobrevivência={row['survival_rate']:.0%} "
+              f"porta={row['door_rate']:.0%} esgotou={row['timeout_rate']:.0%} "
+              f"tempo={row['mean_seconds_to_door']:.1f}s "
+              f"dano={row['mean_damage_taken']:.1f}")
+    total_ticks = sum(result["ticks"] for result in results)
+    print(f"{len(jobs)} partidas, {total_ticks} ticks em {elapsed:.1f}s com {args.workers} processos "
+          f"({total_ticks / elapsed:.0f} ticks/s)")
+    print(f"Resultados salvos em {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
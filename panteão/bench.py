@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from .world import World, Player, Enemy, WIDTH, HEIGHT
+from .profiler import SectionTimer
+from . import enemy_batch
+
+# Benchmark do Panteão.
+# Roda cenários fixos sem janela por N ticks e mede o tempo de cada subsistema
+# por tick (média, p95 e p99 em milissegundos). O resultado vai para um JSON
+# que pode ser comparado entre versões para pegar regressões.
+#
+#   python -m panteão.bench --ticks 600 --output bench.json
+#
+# Subsistemas medidos (os tempos são inclusivos, então "collisions" também
+# aparece dentro de "player_update" e "enemy_update"):
+#   tick             World.step inteiro
+#   player_update    Player.update
+#   enemy_update     World.update_enemies
+#   hits             World.resolve_hits (chicote, habilidades e contato)
+#   collisions       Player/Enemy.check_collisions e, no motor em lote,
+#                    EnemyBatch.sweep_platforms
+#   render           render.draw_world numa superfície fora da tela
+
+BENCH_VERSION = 1
+
+# Comandos do jogador roteirizado, repetidos em ciclo (um a cada 15 ticks)
+SCRIPT = ["right", "jump", "attack", "ability", "left", "jump", "stop", "shield", "stop_shield", "attack", "ability", "right"]
+
+def scenario_level1(seed):
+    return World(level=1, seed=seed)
+
+def scenario_level9(seed):
+    # O nível 9 é o que mais gera inimigos (5 + nível) entre os regulares
+    return World(level=9, seed=seed)
+
+def scenario_boss(seed):
+    return World(level=10, seed=seed)
+
+def scenario_stress(seed, enemy_count=500, batched=False):
+    world = World(level=9, seed=seed, batched=batched)
+    platforms = [p for p in world.platforms if not p.is_ground]
+    for i in range(enemy_count):
+        if i % 2 == 0:
+            x = world.rng.randint(0, 768)
+            y = 518
+        else:
+            platform = world.rng.choice(platforms)
+            x = platform.rect.x + world.rng.randint(0, platform.rect.width - 32)
+            y = platform.rect.y - 32
+        world.enemies.append(Enemy(x, y, world.rng.randint(1, 9), world.level, world.rng, world.projectiles, world.hitboxes))
+    world.enemy_grid_dirty = True
+    return world
+
+def scenario_horde(seed):
+    return scenario_stress(seed, 2000)
+
+def scenario_horde_batched(seed):
+    # Mesma horda no motor em lote (enemy_batch.py)
+    return scenario_stress(seed, 2000, batched=True)
+
+SCENARIOS = {
+    "level1": scenario_level1,
+    "level9_max_enemies": scenario_level9,
+    "level10_boss": scenario_boss,
+    "stress_500": scenario_stress,
+    "horde_2000": scenario_horde,
+    "horde_2000_batched": scenario_horde_batched,
+}
+# Cenários que precisam do NumPy
+BATCHED_SCENARIOS = {"horde_2000_batched"}
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def summarize(samples):
+    summary = {}
+    for subsystem, values in samples.items():
+        ordered = sorted(values)
+        summary[subsystem] = {
+            "mean_ms": round(sum(ordered) / len(ordered) * 1000, 4),
+            "p95_ms": round(percentile(ordered, 0.95) * 1000, 4),
+            "p99_ms": round(percentile(ordered, 0.99) * 1000, 4),
+            "max_ms": round(ordered[-1] * 1000, 4),
+        }
+    return summary
+
+def setup_renderer():
+    # Renderização sem janela: driver de vídeo "dummy" do SDL
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    try:
+        import pygame
+        from pgzero.screen import Screen
+        from . import render
+    except ImportError as e:
+        print(f"Renderização desativada ({e})")
+        return None
+    pygame.display.init()
+    pygame.font.init()
+    surface = pygame.display.set_mode((WIDTH, HEIGHT))
+    return Screen(surface), render
+
+def run_scenario(name, ticks, seed, renderer):
+    world = SCENARIOS[name](seed)
+    # Sem porta e com vida infinita o cenário não muda no meio da medição
+    world.door = None
+    world.player.collected_ability = "energy_wave" if world.level != 10 else "big_fireball"
+    
+    timer = SectionTimer()
+    timer.wrap(Player, "update", "player_update")
+    timer.wrap(World, "update_enemies", "enemy_update")
+    timer.wrap(World, "resolve_hits", "hits")
+    timer.wrap(Player, "check_collisions", "collisions")
+    timer.wrap(Enemy, "check_collisions", "collisions")
+    timer.wrap(enemy_batch.EnemyBatch, "sweep_platforms", "collisions")
+    
+    subsystems = ["tick", "player_update", "enemy_update", "hits", "collisions"]
+    if renderer:
+        target, render = renderer
+        static_layer = render.StaticLayer()
+        hud = render.Hud()
+        subsystems.append("render")
+    samples = {subsystem: [] for subsystem in subsystems}
+    enemies_start = len(world.enemies)
+    
+    try:
+        for tick in range(ticks):
+            inputs = [SCRIPT[(tick // 15) % len(SCRIPT)]] if tick % 15 == 0 else ()
+            world.player.health = world.player.max_health
+            world.player.mana = world.player.max_mana
+            
+            start = time.perf_counter()
+            world.step(inputs)
+            samples["tick"].append(time.perf_counter() - start)
+            world.pop_sound_events()
+            
+            timings = timer.take()
+            for subsystem in ("player_update", "enemy_update", "hits", "collisions"):
+                samples[subsystem].append(timings.get(subsystem, 0.0))
+            
+            if renderer:
+                start = time.perf_counter()
+                render.draw_world(world, target, static_layer, hud)
+                samples["render"].append(time.perf_counter() - start)
+    finally:
+        timer.restore()
+    
+    return {
+        "ticks": ticks,
+        "enemies_start": enemies_start,
+        "enemies_end": len(world.enemies),
+        "subsystems": summarize(samples),
+    }
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Benchmark dos subsistemas do Panteão")
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="cenário a rodar (pode repetir); padrão: todos")
+    parser.add_argument("--no-render", action="store_true", help="não mede a renderização")
+    parser.add_argument("--output", default="bench_output.json")
+    args = parser.parse_args(argv)
+    
+    renderer = None if args.no_render else setup_renderer()
+    results = {
+        "version": BENCH_VERSION,
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "scenarios": {},
+    }
+    for name in args.scenario or list(SCENARIOS):
+        if name in BATCHED_SCENARIOS and not enemy_batch.available:
+            print(f"{name:20s} pulado (NumPy não instalado)")
+            continue
+        result = run_scenario(name, args.ticks, args.seed, renderer)
+        results["scenarios"][name] = result
+        tick = result["subsystems"]["tick"]
+        print(f"{name:20s} inimigos={result['enemies_start']:4d} "
+              f"tick médio={tick['mean_ms']:.3f}ms p95={tick['p95_ms']:.3f}ms p99={tick['p99_ms']:.3f}ms")
+    
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Resultados salvos em {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
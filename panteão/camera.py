@@ -0,0 +1,30 @@
+from .constants import WIDTH, HEIGHT
+from .spatial import Rect
+
+# Câmera do Panteão.
+# Um nível pode ser maior que a janela (size no template, ver levels.py). A
+# câmera centraliza o jogador e para nas bordas do nível; num nível do tamanho
+# da janela ela fica sempre em (0, 0).
+# Não depende de pygame: o World usa a mesma conta para saber quais inimigos
+# estão longe da tela (e dormem) e o render.py para desenhar e descartar o que
+# está fora dela.
+
+class Camera:
+    __slots__ = ("x", "y", "width", "height")
+    
+    def __init__(self, width=WIDTH, height=HEIGHT):
+        self.x = 0
+        self.y = 0
+        self.width = width
+        self.height = height
+    
+    def follow(self, rect, level_width, level_height):
+        # Posição inteira, para os sprites não tremerem entre um pixel e outro
+        x = rect.x + rect.w / 2 - self.width / 2
+        y = rect.y + rect.h / 2 - self.height / 2
+        self.x = int(max(0, min(x, level_width - self.width)))
+        self.y = int(max(0, min(y, level_height - self.height)))
+    
+    def view(self, margin=0):
+        # Área visível em coordenadas do nível, com folga em volta
+        return Rect(self.x - margin, self.y - margin, self.width + margin * 2, self.height + margin * 2)
@@ -0,0 +1,49 @@
+# Colisão contínua (swept AABB) contra as plataformas.
+# Antes o corpo andava o tick inteiro e só então era empurrado para fora do
+# que estivesse encostando, olhando o sinal de velocity_y: um corpo rápido (o
+# pulo e a corrida do boss, uma queda longa) podia estar de um lado de uma
+# plataforma de 20px num tick e do outro no seguinte. Agora o movimento é
+# resolvido um eixo de cada vez: x primeiro, livre, porque as plataformas do
+# jogo não bloqueiam de lado (quem entra numa delas andando sai por cima ou por
+# baixo, em y); depois move_y consulta o broadphase (SweepAndPrune, ver
+# spatial.py) com a caixa que o corpo varre em y e para na primeira face que
+# ele atravessou.
+#
+# Como na checagem antiga, um tick resolve no máximo uma plataforma. Um corpo
+# que já estava enfiado numa plataforma (entrou de lado, levou um empurrão ou
+# teleportou) é resolvido pela primeira em que continua enfiado, se nenhuma
+# face foi atravessada. O EnemyBatch faz a mesma conta em arrays
+# (EnemyBatch.sweep_platforms).
+
+def move_y(rect, dy, obstacles):
+    # Anda dy em y e devolve o obstáculo em que parou (None se andou tudo).
+    # Descendo para na face de cima mais alta atravessada; subindo, na face
+    # de baixo mais baixa. As faces são comparadas com o sinal do movimento
+    if not dy:
+        return None
+    sign = 1 if dy > 0 else -1
+    y = rect.y + dy
+    edge = rect.y + rect.h if dy > 0 else rect.y
+    hit = None
+    hit_face = 0
+    inside = None
+    # Caixa coberta pelo rect andando dy
+    for item in obstacles.query_box(rect.x, rect.y + min(dy, 0), rect.w, rect.h + abs(dy)):
+        other = item.rect
+        face = other.y if dy > 0 else other.y + other.h
+        if (face - edge) * sign < 0:
+            # Já tinha passado desta face antes de andar
+            if inside is None and y < other.y + other.h and y + rect.h > other.y:
+                inside = item
+        elif hit is None or (face - hit_face) * sign < 0:
+            hit = item
+            hit_face = face
+    if hit is None:
+        hit = inside
+    if hit is None:
+        rect.y = y
+    elif dy > 0:
+        rect.y = hit.rect.y - rect.h
+    else:
+        rect.y = hit.rect.y + hit.rect.h
+    return hit
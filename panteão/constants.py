@@ -0,0 +1,29 @@
+# Constantes compartilhadas pela simulação e pela renderização
+
+# Configurações globais
+WIDTH = 800
+HEIGHT = 600
+# Hitbox do jogador (quadrado)
+PLAYER_SIZE = 32
+
+# Cores
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+BROWN = (139, 69, 19)
+PURPLE = (128, 0, 128)
+ORANGE = (255, 165, 0)
+DARK_BLUE = (0, 0, 139)
+GRAY = (100, 100, 100)
+YELLOW = (255, 255, 0)
+DARK_PURPLE = (50, 0, 50)
+GOLD = (255, 215, 0)
+DARK_RED = (139, 0, 0)
+CYAN = (0, 255, 255)
+LAVA = (255, 80, 0)
+DARK_GREEN = (0, 100, 0)
+LIGHT_BLUE = (173, 216, 230)
+PINK = (255, 192, 203)
+SILVER = (192, 192, 192)
@@ -0,0 +1,185 @@
+import math
+import random
+
+from .constants import YELLOW, ORANGE, RED, DARK_RED, CYAN
+from .spatial import Rect
+from .hitboxes import TARGET_ENEMIES
+
+# Efeitos das habilidades do jogador.
+# Cada habilidade tem a sua classe com __slots__ e os próprios update,
+# hit_test e draw, no lugar dos dicionários com "type" comparado por string.
+# A área de acerto (hit_area) é calculada uma vez no reset, já que os efeitos
+# acertam a partir do ponto em que foram lançados, e vira uma hitbox a cada
+# tick (ver hitboxes.py). draw(target) só é chamado pela renderização e usa
+# apenas primitivas que não pedem Rect do pgzero (a barra do PainSpikes é
+# feita de linhas), para a simulação continuar sem pygame.
+
+class Effect:
+    __slots__ = ("x", "y", "timer", "damage", "hit_area")
+    
+    def update(self):
+        self.timer -= 1
+    
+    def hit_test(self, enemy):
+        return True
+    
+    def declare_hitboxes(self, hitboxes):
+        # Chamado pelo Player a cada tick depois do update do efeito
+        if self.hit_area is not None:
+            hitboxes.declare(self, self.hit_area, self.damage, TARGET_ENEMIES, hit_test=self.hit_test)
+    
+    def draw(self, target):
+        pass
+
+class BigFireball(Effect):
+    __slots__ = ("direction",)
+    
+    def reset(self, x, y, direction):
+        self.x = x
+        self.y = y
+        self.direction = direction
+        self.timer = 60
+        self.damage = 50
+        self.hit_area = Rect(x - 20, y - 20, 40, 40)
+    
+    def draw(self, target):
+        x = self.x + self.direction * 10 * (60 - self.timer)
+        target.draw.filled_circle((x, self.y), 20, ORANGE)
+        target.draw.circle((x, self.y), 20, RED)
+
+class EnergyWave(Effect):
+    __slots__ = ("radius",)
+    
+    def reset(self, x, y):
+        self.x = x
+        self.y = y
+        self.radius = 10
+        self.timer = 30
+        self.damage = 40
+        self.hit_area = Rect(x - self.radius, y - self.radius, self.radius * 2, self.radius * 2)
+    
+    def hit_test(self, enemy):
+        distance = math.sqrt((enemy.rect.centerx - self.x)**2 + (enemy.rect.centery - self.y)**2)
+        return distance < self.radius
+    
+    def draw(self, target):
+        radius = self.radius + (30 - self.timer) * 5
+        target.draw.circle((self.x, self.y), radius, CYAN)
+
+class Lightning(Effect):
+    # Pontas dos raios e o timer em que foram sorteadas
+    __slots__ = ("bolts", "bolts_timer")
+    
+    def reset(self, x, y):
+        self.x = x
+        self.y = y
+        self.timer = 60
+        self.damage = 35
+        self.hit_area = None
+        self.bolts = []
+        self.bolts_timer = None
+    
+    def draw(self, target):
+        # Raios novos a cada tick (não a cada frame); usa o random global para
+        # não mexer no RNG da partida
+        if self.bolts_timer != self.timer:
+            self.bolts_timer = self.timer
+            self.bolts = []
+            for i in range(5):
+                angle = random.uniform(0, 2 * math.pi)
+                length = random.randint(50, 150)
+                self.bolts.append((self.x + math.cos(angle) * length, self.y + math.sin(angle) * length))
+        for end in self.bolts:
+            target.draw.line((self.x, self.y), end, YELLOW)
+
+class EnergyOrbs(Effect):
+    # Posições dos 3 orbes e o ângulo para o qual foram calculadas
+    __slots__ = ("angle", "positions", "positions_angle")
+    
+    def reset(self, x, y):
+        self.x = x
+        self.y = y
+        self.timer = 600
+        self.angle = 0
+        self.damage = 10
+        self.hit_area = None
+        self.positions = []
+        self.positions_angle = None
+    
+    def update(self):
+        self.angle += 0.1
+        self.timer -= 1
+    
+    def orb_positions(self):
+        # Recalculadas só quando o ângulo muda (uma vez por tick), para o
+        # desenho e as partículas do rastro
+        if self.positions_angle != self.angle:
+            self.positions_angle = self.angle
+            self.positions = []
+            for i in range(3):
+                angle = self.angle + i * (2 * math.pi / 3)
+                self.positions.append((self.x + math.cos(angle) * 40, self.y + math.sin(angle) * 40))
+        return self.positions
+    
+    def draw(self, target):
+        for x, y in self.orb_positions():
+            target.draw.filled_circle((x, y), 10, YELLOW)
+            target.draw.circle((x, y), 10, ORANGE)
+
+class PainSpikes(Effect):
+    __slots__ = ("direction",)
+    
+    def reset(self, x, y, direction):
+        self.x = x
+        self.y = y
+        self.direction = direction
+        self.timer = 60
+        self.damage = 60
+        self.hit_area = Rect(x - 30, y - 5, 60, 10)
+    
+    def draw(self, target):
+        x = self.x + self.direction * 10 * (60 - self.timer)
+        # Barra de 60x10, uma linha por fileira de pixels
+        for row in range(10):
+            y = self.y - 5 + row
+            target.draw.line((x - 30, y), (x + 29, y), DARK_RED)
+        for i in range(6):
+            spike_x = x - 25 + i * 10
+            target.draw.line((spike_x, self.y - 5), (spike_x + 5, self.y - 15), RED)
+
+class EffectPool:
+    # Lista dos efeitos ativos + instâncias livres por classe para reaproveitar.
+    # Efeitos expirados saem por compactação, mantendo a ordem dos que ficam.
+    def __init__(self):
+        self.active = []
+        self.free = {}
+    
+    def __iter__(self):
+        return iter(self.active)
+    
+    def __len__(self):
+        return len(self.active)
+    
+    def spawn(self, effect_class, *args):
+        free = self.free.get(effect_class)
+        effect = free.pop() if free else effect_class()
+        effect.reset(*args)
+        self.active.append(effect)
+        return effect
+    
+    def update(self):
+        active = self.active
+        kept = 0
+        for effect in active:
+            effect.update()
+            if effect.timer > 0:
+                active[kept] = effect
+                kept += 1
+            else:
+                self.free.setdefault(type(effect), []).append(effect)
+        del active[kept:]
+    
+    def clear(self):
+        for effect in self.active:
+            self.free.setdefault(type(effect), []).append(effect)
+        self.active.clear()
@@ -0,0 +1,266 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .hitboxes import TARGET_PLAYER
+
+# Motor em lote dos inimigos, para hordas com milhares de inimigos.
+# Posição, velocidade, velocidade de andar, alcance de aggro e timers ficam
+# em arrays NumPy (uma coluna por atributo, uma linha por inimigo) e a parte
+# comum do Enemy.update (lentidão, gravidade, plataformas com varredura,
+# distância até o jogador, perseguição, patrulha e animação) roda em poucas
+# operações vetorizadas. Só os tipos com comportamento próprio (HOOK_TYPES)
+# voltam para os métodos do Enemy, um por um.
+#
+# Durante a partida os arrays são a fonte da verdade; rect.x, rect.y e
+# direction são copiados de volta a cada tick porque o resto do jogo (grade,
+# hitboxes, desenho) lê os objetos. sync() copia o resto do estado.
+# As viradas aleatórias da patrulha usam um gerador próprio, então um World
+# em lote é determinístico, mas não repete a partida de um World normal.
+# Inimigos fora da área acordada (awake, ver World.update_enemies) ficam
+# parados: todas as máscaras abaixo são combinadas com ela.
+
+available = np is not None
+
+# Tipos que precisam dos métodos do Enemy além do movimento comum
+HOOK_TYPES = (2, 4, 5, 7, 8, 9, 10)
+BOSS_TYPE = 10
+AGGRO_TICKS = 120
+SLOW_TICKS = 600
+SLOW_FACTOR = 0.4
+ANIMATION_TICKS = 15
+PATROL_TURN_CHANCE = 0.01
+CONTACT_KNOCKBACK = 20
+
+# Colunas: nome -> (atributo do Enemy, dtype)
+COLUMNS = {
+    "vy": ("velocity_y", "f8"),
+    "gravity": ("gravity", "f8"),
+    "speed": ("speed", "f8"),
+    "aggro_range": ("aggro_range", "f8"),
+    "aggro": ("aggro", "?"),
+    "aggro_timer": ("aggro_timer", "i4"),
+    "direction": ("direction", "i4"),
+    "jumping": ("is_jumping", "?"),
+    "slowed": ("slowed", "?"),
+    "slow_timer": ("slow_timer", "i4"),
+    "anim_timer": ("animation_timer", "i4"),
+    "anim_frame": ("animation_frame", "i4"),
+}
+
+class EnemyBatch:
+    def __init__(self, seed):
+        if np is None:
+            raise ImportError("O motor em lote dos inimigos precisa do NumPy")
+        self.random = np.random.default_rng(seed)
+        self.members = []
+        self.platforms = None
+        self.gather([])
+    
+    def gather(self, enemies):
+        # Monta todos os arrays a partir dos objetos
+        self.members = list(enemies)
+        self.x = np.array([e.rect.x for e in enemies], dtype="f8")
+        self.y = np.array([e.rect.y for e in enemies], dtype="f8")
+        self.w = np.array([e.rect.w for e in enemies], dtype="f8")
+        self.h = np.array([e.rect.h for e in enemies], dtype="f8")
+        for column, (attribute, dtype) in COLUMNS.items():
+            setattr(self, column, np.array([getattr(e, attribute) for e in enemies], dtype=dtype))
+        self.type = np.array([e.type for e in enemies], dtype="i4")
+        self.flying = np.array([getattr(e, "flying", False) for e in enemies], dtype="?")
+        self.boss = self.type == BOSS_TYPE
+        self.hooks = np.flatnonzero(np.isin(self.type, HOOK_TYPES)).tolist()
+    
+    def sync_members(self, enemies):
+        # O World remove inimigos mortos e troca a lista a cada nível; aqui
+        # as linhas dos que continuam são aproveitadas e só os novos são lidos
+        if self.members == enemies:
+            return
+        rows = {id(enemy): i for i, enemy in enumerate(self.members)}
+        keep = [rows.get(id(enemy), -1) for enemy in enemies]
+        if -1 in keep:
+            self.sync()
+            self.gather(enemies)
+            return
+        for column in ("x", "y", "w", "h", "type", "flying", "boss") + tuple(COLUMNS):
+            setattr(self, column, getattr(self, column)[keep])
+        self.members = list(enemies)
+        self.hooks = np.flatnonzero(np.isin(self.type, HOOK_TYPES)).tolist()
+    
+    def sync_platforms(self, platforms):
+        if platforms is self.platforms:
+            return
+        self.platforms = platforms
+        self.platform_rects = [(p.rect.x, p.rect.y, p.rect.w, p.rect.h) for p in platforms]
+    
+    def sync(self):
+        # Copia todo o estado dos arrays para os objetos Enemy
+        columns = [(attribute, getattr(self, column).tolist()) for column, (attribute, dtype) in COLUMNS.items()]
+        for i, (enemy, x, y) in enumerate(zip(self.members, self.x.tolist(), self.y.tolist())):
+            enemy.rect.x = x
+            enemy.rect.y = y
+            for attribute, values in columns:
+                setattr(enemy, attribute, values[i])
+    
+    def write_row(self, i, enemy):
+        enemy.velocity_y = float(self.vy[i])
+        enemy.is_jumping = bool(self.jumping[i])
+        enemy.speed = float(self.speed[i])
+        enemy.aggro = bool(self.aggro[i])
+    
+    def read_row(self, i, enemy):
+        self.x[i] = enemy.rect.x
+        self.y[i] = enemy.rect.y
+        self.vy[i] = enemy.velocity_y
+        self.jumping[i] = enemy.is_jumping
+        self.speed[i] = enemy.speed
+        self.direction[i] = enemy.direction
+    
+    def sweep_platforms(self, moving):
+        # O mesmo que collision.move_y para todos de uma vez. Sweep-and-prune:
+        # com os inimigos ordenados por x, cada plataforma só olha a faixa dos
+        # que podem cruzar ela em x (busca binária), não o array inteiro
+        x, y, w, h, vy = self.x, self.y, self.w, self.h, self.vy
+        rows = np.flatnonzero(moving)
+        if not len(rows):
+            return
+        rows = rows[np.argsort(x[rows], kind="stable")]
+        lefts = x[rows]
+        widest = w[rows].max()
+        down = vy > 0
+        target = y + vy
+        edge = np.where(down, y + h, y)
+        # Caixa varrida (a mesma de collision.move_y)
+        box_y = y + np.minimum(vy, 0)
+        box_bottom = box_y + (h + np.abs(vy))
+        # Face atravessada mais perto e primeira plataforma em que já estava
+        face = np.full(len(x), np.nan)
+        inside = np.full(len(x), np.nan)
+        for px, py, pw, ph in self.platform_rects:
+            lo = np.searchsorted(lefts, px - widest, "right")
+            hi = np.searchsorted(lefts, px + pw, "left")
+            if lo >= hi:
+                continue
+            i = rows[lo:hi]
+            i = i[(x[i] < px + pw) & (x[i] + w[i] > px) & (box_y[i] < py + ph) & (box_bottom[i] > py)]
+            if not len(i):
+                continue
+            crossed = np.where(down[i], py >= edge[i], py + ph <= edge[i])
+            j = i[crossed]
+            stop = np.where(down[j], py, py + ph)
+            current = face[j]
+            closer = np.isnan(current) | np.where(down[j], stop < current, stop > current)
+            face[j[closer]] = stop[closer]
+            k = i[~crossed]
+            k = k[np.isnan(inside[k]) & (target[k] < py + ph) & (target[k] + h[k] > py)]
+            inside[k] = np.where(down[k], py, py + ph)
+        face = np.where(np.isnan(face), inside, face)
+        hit = ~np.isnan(face)
+        y[moving] = target[moving]
+        landed = hit & down
+        y[landed] = face[landed] - h[landed]
+        self.jumping[landed] = False
+        bumped = hit & ~down
+        y[bumped] = face[bumped]
+        vy[hit] = 0
+    
+    def update(self, enemies, player, platforms, hitboxes, slow_time, bounds, awake_area):
+        self.sync_members(enemies)
+        self.sync_platforms(platforms)
+        if not self.members:
+            return
+        x, y, w, h = self.x, self.y, self.w, self.h
+        vy = self.vy
+        speed = self.speed
+        direction = self.direction
+        width, height = bounds
+        
+        awake = ((x < awake_area.x + awake_area.w) & (y < awake_area.y + awake_area.h)
+                 & (x + w > awake_area.x) & (y + h > awake_area.y))
+        
+        # Lentidão temporal acabando
+        slowed = self.slowed & awake
+        ending = slowed & (self.slow_timer <= 1)
+        self.slow_timer[slowed] -= 1
+        if ending.any():
+            self.slowed[ending] = False
+            speed[ending] /= SLOW_FACTOR
+        
+        # Gravidade e plataformas (quem voa não cai nem colide)
+        ground = ~self.flying & awake
+        vy[ground] += self.gravity[ground]
+        self.sweep_platforms(ground & (vy != 0))
+        left = ground & (x < 0)
+        x[left] = 0
+        direction[left] = 1
+        right = ground & (x + w > width)
+        x[right] = width - w[right]
+        direction[right] = -1
+        floor = ground & (y + h > height)
+        y[floor] = height - h[floor]
+        vy[floor] = 0
+        self.jumping[floor] = False
+        
+        # Aggro pela distância ao quadrado (sem sqrt)
+        player_x = player.rect.x
+        player_y = player.rect.y
+        in_range = awake & ((x - player_x) ** 2 + (y - player_y) ** 2 < self.aggro_range ** 2)
+        cooling = awake & ~in_range & (self.aggro_timer > 0)
+        self.aggro_timer[cooling] -= 1
+        self.aggro[awake & ~in_range & ~cooling] = False
+        self.aggro[in_range] = True
+        self.aggro_timer[in_range] = AGGRO_TICKS
+        
+        # Perseguição e patrulha (o boss tem o próprio comportamento)
+        walkers = ~self.boss & awake
+        chase = self.aggro & walkers
+        toward = np.where(x < player_x, 1, -1)
+        x[chase] += speed[chase] * toward[chase]
+        direction[chase] = toward[chase]
+        patrol = ~self.aggro & walkers
+        x[patrol] += speed[patrol] * direction[patrol]
+        turn = patrol & ((x < 0) | (x + w > width) | (self.random.random(len(x)) < PATROL_TURN_CHANCE))
+        direction[turn] *= -1
+        
+        # Animação
+        self.anim_timer[awake] += 1
+        frame_done = awake & (self.anim_timer >= ANIMATION_TICKS)
+        self.anim_frame[frame_done] = (self.anim_frame[frame_done] + 1) % 4
+        self.anim_timer[frame_done] = 0
+        
+        # O resto do jogo lê os objetos
+        members = self.members
+        for enemy, ex, ey, ed in zip(members, x.tolist(), y.tolist(), direction.tolist()):
+            rect = enemy.rect
+            rect.x = ex
+            rect.y = ey
+            enemy.direction = ed
+        
+        # Comportamentos próprios de cada tipo, nos métodos do Enemy
+        aggro = self.aggro
+        for i in self.hooks:
+            if not awake[i]:
+                continue
+            enemy = members[i]
+            if self.boss[i]:
+                self.write_row(i, enemy)
+                enemy.boss_behavior(player)
+                self.read_row(i, enemy)
+            elif aggro[i]:
+                self.write_row(i, enemy)
+                enemy.aggro_special(player)
+                self.read_row(i, enemy)
+        
+        if slow_time:
+            slowing = ~self.slowed & awake
+            self.slowed[slowing] = True
+            self.slow_timer[slowing] = SLOW_TICKS
+            speed[slowing] *= SLOW_FACTOR
+        
+        # Dano de contato: hitbox só para quem está encostando no jogador
+        prect = player.rect
+        touching = (x < prect.x + prect.w) & (y < prect.y + prect.h) & (x + w > prect.x) & (y + h > prect.y)
+        for i in np.flatnonzero(touching).tolist():
+            enemy = members[i]
+            hitboxes.declare(enemy, enemy.rect, enemy.damage, TARGET_PLAYER, knockback=CONTACT_KNOCKBACK)
@@ -0,0 +1,59 @@
+# Eventos de combate do tick.
+# Quem acerta alguém não mexe mais na vida de ninguém: os tiros
+# (projectiles.py) e World.resolve_hits enfileiram um DAMAGE por acerto, e
+# World.process_events processa a fila uma vez por tick, na ordem em que os
+# acertos aconteceram. Um dano que mata vira DEATH (ou NECROMANCY, com a
+# habilidade do necromante ativa) no fim da mesma fila.
+#
+# O inimigo morto é só marcado (dead) na hora, para os acertos seguintes do
+# mesmo tick não contarem; ele sai da lista do World numa compactação só
+# depois da fila, em vez de um list.remove por morte.
+
+DAMAGE = "damage"
+DEATH = "death"
+NECROMANCY = "necromancy"
+
+class CombatEvent:
+    __slots__ = ("kind", "target", "amount", "source_x", "knockback")
+
+class EventQueue:
+    # Eventos pendentes + instâncias livres para reaproveitar, como no HitboxSystem
+    def __init__(self):
+        self.pending = []
+        self.free = []
+    
+    def __len__(self):
+        return len(self.pending)
+    
+    def push(self, kind, target, amount=0, source_x=0, knockback=0):
+        event = self.free.pop() if self.free else CombatEvent()
+        event.kind = kind
+        event.target = target
+        event.amount = amount
+        # Posição x de quem acertou, para o lado do empurrão
+        event.source_x = source_x
+        event.knockback = knockback
+        self.pending.append(event)
+        return event
+    
+    def damage(self, target, amount, source_x=0, knockback=0):
+        return self.push(DAMAGE, target, amount, source_x, knockback)
+    
+    def drain(self):
+        # Devolve os eventos na ordem, inclusive os enfileirados enquanto a
+        # fila é percorrida, e recicla todos no fim
+        pending = self.pending
+        i = 0
+        while i < len(pending):
+            yield pending[i]
+            i += 1
+        for event in pending:
+            event.target = None
+            self.free.append(event)
+        pending.clear()
+    
+    def clear(self):
+        for event in self.pending:
+            event.target = None
+            self.free.append(event)
+        self.pending.clear()
@@ -0,0 +1,66 @@
+# Hitboxes do combate.
+# Durante o update, quem causa dano declara uma hitbox: o chicote e os efeitos
+# de habilidade do jogador (alvo: inimigos) e o corpo de cada inimigo (alvo:
+# jogador). Depois que todo mundo se moveu, World.resolve_hits resolve todas
+# de uma vez contra as hurtboxes do alvo, que são o rect do jogador e a grade
+# espacial de inimigos. Nada disso depende do desenho ter rodado.
+#
+# Uma hitbox vale por `lifetime` ticks (1 = só o tick em que foi declarada);
+# o rect é guardado por referência, então uma hitbox declarada com o rect da
+# entidade acompanha a entidade enquanto durar.
+
+TARGET_ENEMIES = "enemies"
+TARGET_PLAYER = "player"
+
+class Hitbox:
+    __slots__ = ("owner", "rect", "damage", "target", "lifetime", "hit_test", "knockback")
+
+class HitboxSystem:
+    # Hitboxes ativas + instâncias livres para reaproveitar, como no EffectPool
+    def __init__(self):
+        self.active = []
+        self.free = []
+    
+    def __iter__(self):
+        return iter(self.active)
+    
+    def __len__(self):
+        return len(self.active)
+    
+    def declare(self, owner, rect, damage, target, lifetime=1, hit_test=None, knockback=0):
+        hitbox = self.free.pop() if self.free else Hitbox()
+        hitbox.owner = owner
+        hitbox.rect = rect
+        hitbox.damage = damage
+        hitbox.target = target
+        hitbox.lifetime = lifetime
+        # hit_test(alvo) refina a colisão dos rects (ex.: raio da onda de energia)
+        hitbox.hit_test = hit_test
+        # Empurrão no jogador quando o acerto dá dano
+        hitbox.knockback = knockback
+        self.active.append(hitbox)
+        return hitbox
+    
+    def expire(self):
+        # Fim do tick: tira as hitboxes cujo tempo acabou, mantendo a ordem
+        active = self.active
+        kept = 0
+        for hitbox in active:
+            hitbox.lifetime -= 1
+            if hitbox.lifetime > 0:
+                active[kept] = hitbox
+                kept += 1
+            else:
+                hitbox.owner = None
+                hitbox.rect = None
+                hitbox.hit_test = None
+                self.free.append(hitbox)
+        del active[kept:]
+    
+    def clear(self):
+        for hitbox in self.active:
+            hitbox.owner = None
+            hitbox.rect = None
+            hitbox.hit_test = None
+            self.free.append(hitbox)
+        self.active.clear()
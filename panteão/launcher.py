@@ -0,0 +1,72 @@
+import argparse
+import os
+import sys
+import time
+
+# Ponto de entrada do Panteão (comando `panteao` depois do pip install, ou
+# python -m panteão a partir da pasta do repositório).
+# Importar o pacote não inicia nada: o pygame só sobe aqui, e o jogo deixa para
+# depois da primeira tela tudo o que ela não precisa. O nível só é montado
+# quando a partida começa (Game.start_run) e os sons são carregados no frame
+# seguinte ao primeiro (main.load_deferred). O tempo de cada etapa é medido e
+# comparado com STARTUP_BUDGET:
+#
+#   panteao --startup     mostra os tempos e sai depois de carregar os sons
+#
+# Sem --startup os tempos só aparecem quando o primeiro frame passa do
+# orçamento.
+
+# Tempo máximo do início do processo até o primeiro frame, em segundos
+STARTUP_BUDGET = 0.5
+
+class StartupTimer:
+    def __init__(self, budget=STARTUP_BUDGET, report=False, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self.last = self.start
+        self.budget = budget
+        self.report = report
+        self.stages = []
+        self.first_frame = None
+    
+    def mark(self, stage):
+        now = time.perf_counter()
+        self.stages.append((stage, now - self.last))
+        self.last = now
+        if stage == "first_frame":
+            self.first_frame = now - self.start
+    
+    def over_budget(self):
+        return self.first_frame is not None and self.first_frame > self.budget
+    
+    def finish(self):
+        # Chamado pelo jogo quando não falta mais nada para carregar
+        if self.report or self.over_budget():
+            print(f"Inicialização: primeiro frame em {self.first_frame * 1000:.0f}ms "
+                  f"(orçamento {self.budget * 1000:.0f}ms)")
+            for stage, seconds in self.stages:
+                print(f"  {stage:12s} {seconds * 1000:8.1f}ms")
+        if self.report:
+            sys.exit(1 if self.over_budget() else 0)
+
+def main(argv=None):
+    start = time.perf_counter()
+    parser = argparse.ArgumentParser(prog="panteao", description="Panteão")
+    parser.add_argument("--startup", action="store_true",
+                        help="mede a inicialização e sai quando ela termina")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET,
+                        help="orçamento até o primeiro frame, em segundos")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    timer = StartupTimer(args.budget, args.startup, start)
+    
+    os.environ.setdefault("SDL_VIDEO_CENTERED", "1")
+    # Inicia o pygame (e o mixer no formato do assets.py)
+    from pgzero.runner import prepare_mod, run_mod
+    timer.mark("pygame")
+    from . import main as game_module
+    timer.mark("import")
+    # Loaders de imagens e sons relativos ao main.py, não ao diretório atual
+    prepare_mod(game_module)
+    timer.mark("window")
+    game_module.start(timer)
+    run_mod(game_module)
+    return 0
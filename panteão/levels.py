@@ -0,0 +1,157 @@
+import random
+import threading
+from collections import OrderedDict
+
+from .constants import WIDTH, HEIGHT, PLAYER_SIZE
+
+# Níveis do Panteão descritos como dados.
+# Cada nível é um template declarativo (plataformas, hazards, inimigos, porta e
+# orbe). compile_level(level) transforma o template uma única vez num
+# CompiledLevel imutável, com a posição da porta e os pontos de spawn já
+# calculados. spawn_plan(level, seed) sorteia onde e de que tipo nasce cada
+# inimigo com um gerador próprio daquele nível e guarda o resultado por
+# (nível, semente): recomeçar um nível não sorteia nem calcula nada de novo.
+# Os caches têm lock porque o próximo nível pode ser montado numa thread.
+#
+# "size": (largura, altura) faz um nível maior que a janela, com câmera (ver
+# camera.py); sem ele o nível tem o tamanho da tela. O chão ocupa sempre a
+# base do nível e o jogador começa em cima dele, à esquerda, a menos que o
+# template diga outro "player".
+
+GROUND_HEIGHT = 50
+ENEMY_SIZE = 32
+# Faixa do chão onde nascem os inimigos sorteados: distância das bordas em x
+GROUND_SPAWN_MARGIN = 100
+# A porta fica centrada em cima da plataforma mais alta
+DOOR_WIDTH = 50
+DOOR_HEIGHT = 70
+
+ABILITY_ORDER = (
+    "big_fireball", "energy_wave", "lightning",
+    "slow_time", "energy_orbs", "necromancer",
+    "pain_spikes", "superman"
+)
+
+TEMPLATES = {
+    # Tutorial
+    1: {
+        "platforms": [(100, 450, 150, 20), (350, 350, 150, 20), (600, 450, 150, 20)],
+        "enemies": [(200, 518, 1), (400, 518, 1), (600, 518, 1), (300, 418, 1), (500, 418, 1)],
+        "door": (675, 320),
+        "orb": (700, 520, "big_fireball"),
+    },
+    # Boss
+    10: {
+        "platforms": [(150, 450, 150, 20), (500, 450, 150, 20)],
+        "enemies": [(400, 350, 10)],
+        "door": (675, 380),
+        "orb": (700, 520, "superman"),
+        "ability_choices": ABILITY_ORDER,
+    },
+}
+
+def regular_template(level):
+    # Níveis regulares: plataformas em zigue-zague subindo, hazards no chão a
+    # partir do nível 4 e 5 + nível inimigos sorteados
+    platforms = []
+    for i in range(min(5 + level, 10)):
+        x = 100 if i % 2 == 0 else 500
+        platforms.append((x, 500 - i * 60, 200, 20))
+    hazard_count = max(0, min(level - 3, 4))
+    hazards = [(x, 550, 50, 50) for x in (200, 400, 600)[:hazard_count]]
+    orb = None
+    if level - 1 < len(ABILITY_ORDER):
+        orb = (700, 520, ABILITY_ORDER[level - 1])
+    return {
+        "platforms": platforms,
+        "hazards": hazards,
+        "random_enemies": (5 + level, min(level, 9)),
+        "door": "top_platform",
+        "orb": orb,
+    }
+
+def template_for(level):
+    return TEMPLATES.get(level) or regular_template(level)
+
+class CompiledLevel:
+    __slots__ = ("level", "bounds", "player_start", "platforms", "hazards", "door", "orb",
+                 "ability_choices", "fixed_spawns", "random_enemies", "spawn_anchors", "ground_spawn")
+    
+    def __init__(self, level, template):
+        self.level = level
+        width, height = template.get("size", (WIDTH, HEIGHT))
+        self.bounds = (width, height)
+        ground_y = height - GROUND_HEIGHT
+        self.player_start = template.get("player", (50, ground_y - PLAYER_SIZE))
+        # (x, y, largura, altura, é_chão); o chão vem sempre primeiro
+        ground = (0, ground_y, width, GROUND_HEIGHT, True)
+        self.platforms = (ground,) + tuple(p + (False,) for p in template["platforms"])
+        self.hazards = tuple(template.get("hazards", ()))
+        self.orb = template.get("orb")
+        self.ability_choices = template.get("ability_choices")
+        self.fixed_spawns = tuple(template.get("enemies", ()))
+        self.random_enemies = template.get("random_enemies")
+        # Onde um inimigo pode nascer em cima de cada plataforma: x, y e folga em x
+        self.spawn_anchors = tuple((x, y - ENEMY_SIZE, w - ENEMY_SIZE)
+                                   for x, y, w, h in template["platforms"])
+        # Inimigos sorteados no chão: x mínimo, x máximo e y
+        self.ground_spawn = (GROUND_SPAWN_MARGIN, width - GROUND_SPAWN_MARGIN, ground_y - ENEMY_SIZE)
+        
+        door = template["door"]
+        if door == "top_platform":
+            x, y, w, h = min(template["platforms"], key=lambda p: p[1])
+            door = (x + w // 2 - DOOR_WIDTH // 2, y - DOOR_HEIGHT)
+        self.door = door
+
+class SpawnPlan:
+    __slots__ = ("spawns", "enemy_seed")
+    
+    def __init__(self, spawns, enemy_seed):
+        # (x, y, tipo) de cada inimigo, na ordem em que são criados
+        self.spawns = spawns
+        # Semente dos atributos sorteados no construtor do Enemy (velocidade)
+        self.enemy_seed = enemy_seed
+
+_compiled = {}
+# Planos das últimas partidas; cada partida usa no máximo 10
+PLAN_CACHE_SIZE = 64
+_plans = OrderedDict()
+_lock = threading.RLock()
+
+def compile_level(level):
+    with _lock:
+        compiled = _compiled.get(level)
+        if compiled is None:
+            compiled = CompiledLevel(level, template_for(level))
+            _compiled[level] = compiled
+        return compiled
+
+def spawn_plan(level, seed):
+    key = (level, seed)
+    with _lock:
+        plan = _plans.get(key)
+        if plan is not None:
+            _plans.move_to_end(key)
+            return plan
+    
+    compiled = compile_level(level)
+    rng = random.Random(f"{seed}/{level}")
+    spawns = list(compiled.fixed_spawns)
+    if compiled.random_enemies:
+        count, max_type = compiled.random_enemies
+        low, high, ground_y = compiled.ground_spawn
+        for i in range(count):
+            if i % 2 == 0:
+                x = rng.randint(low, high)
+                y = ground_y
+            else:
+                anchor_x, y, slack = rng.choice(compiled.spawn_anchors)
+                x = anchor_x + rng.randint(0, slack)
+            spawns.append((x, y, rng.randint(1, max_type)))
+    plan = SpawnPlan(tuple(spawns), rng.randrange(2**32))
+    
+    with _lock:
+        _plans[key] = plan
+        if len(_plans) > PLAN_CACHE_SIZE:
+            _plans.popitem(last=False)
+    return plan
@@ -0,0 +1,163 @@
+import math
+import random
+from array import array
+
+from .events import DAMAGE, DEATH, NECROMANCY
+from .effects import Lightning, EnergyOrbs
+from .constants import WHITE, YELLOW, RED, ORANGE, DARK_PURPLE
+
+# Partículas de feedback visual (acertos, mortes, necromancia e habilidades).
+# Como os tiros (projectiles.py), todas as partículas ficam em arrays
+# paralelos alocados uma vez, com as vivas em [0, count): a que acaba é
+# trocada com a última. Nada é alocado por partícula nem por frame.
+#
+# As partículas são só visuais: os emissores recebem os eventos de combate do
+# World (World.combat_listener, ver events.py) e olham os efeitos de
+# habilidade ativos, mas nunca mexem na partida nem no RNG dela. Sem ninguém
+# ligado ao World (bench, balance, replay) nada disso roda.
+#
+# Orçamento: o pool tem capacidade fixa e cada rajada sai menor quanto mais
+# cheio ele estiver (ver budget), então muita coisa acontecendo ao mesmo tempo
+# deixa as rajadas mais ralas em vez de custar mais por frame.
+
+PARTICLE_BUDGET = 768
+PARTICLE_GRAVITY = 0.2
+
+class ParticleSystem:
+    def __init__(self, capacity=PARTICLE_BUDGET):
+        self.capacity = capacity
+        self.x = array("d", [0.0]) * capacity
+        self.y = array("d", [0.0]) * capacity
+        self.vx = array("d", [0.0]) * capacity
+        self.vy = array("d", [0.0]) * capacity
+        # Gravidade de cada uma (negativa sobe)
+        self.gravity = array("d", [0.0]) * capacity
+        self.life = array("l", [0]) * capacity
+        self.color = array("B", [0]) * capacity
+        self.count = 0
+        # Cores por índice; o array guarda só o índice
+        self.colors = []
+        self.color_index = {}
+        # Gerador próprio: a partida não depende das partículas
+        self.rng = random.Random()
+        self.world = None
+        self.layout_version = None
+        self.restore_version = None
+    
+    def __len__(self):
+        return self.count
+    
+    def attach(self, world):
+        # Passa a receber os eventos de combate deste World
+        if self.world is not None and self.world is not world:
+            self.world.combat_listener = None
+        world.combat_listener = self.on_combat
+        self.world = world
+        self.clear()
+    
+    def clear(self):
+        self.count = 0
+    
+    def budget(self, requested):
+        # Quantas partículas uma rajada pode usar: todas com o pool vazio,
+        # metade com ele pela metade, nenhuma com ele cheio
+        free = self.capacity - self.count
+        if free <= 0:
+            return 0
+        return max(1, requested * free // self.capacity)
+    
+    def index_of(self, color):
+        index = self.color_index.get(color)
+        if index is None:
+            index = len(self.colors)
+            self.colors.append(color)
+            self.color_index[color] = index
+        return index
+    
+    def burst(self, x, y, requested, color, speed, life, gravity=PARTICLE_GRAVITY):
+        # Rajada em todas as direções a partir de (x, y)
+        count = self.budget(requested)
+        color = self.index_of(color)
+        rng = self.rng
+        i = self.count
+        for _ in range(count):
+            angle = rng.uniform(0, 2 * math.pi)
+            velocity = rng.uniform(speed * 0.3, speed)
+            self.x[i] = x
+            self.y[i] = y
+            self.vx[i] = math.cos(angle) * velocity
+            self.vy[i] = math.sin(angle) * velocity
+            self.gravity[i] = gravity
+            self.life[i] = rng.randint(life // 2, life)
+            self.color[i] = color
+            i += 1
+        self.count = i
+    
+    def on_combat(self, kind, target):
+        rect = target.rect
+        if kind == DAMAGE:
+            if target is self.world.player:
+                self.burst(rect.centerx, rect.centery, 10, RED, 3, 20)
+            else:
+                self.burst(rect.centerx, rect.centery, 6, WHITE, 3, 14)
+        elif kind == DEATH:
+            self.burst(rect.centerx, rect.centery, 24, target.color, 4, 36)
+        elif kind == NECROMANCY:
+            self.burst(rect.centerx, rect.centery, 16, DARK_PURPLE, 1.5, 40, -0.05)
+    
+    def emit_effects(self, player):
+        # Emissores contínuos das habilidades, um pouco por tick
+        for effect in player.ability_effects:
+            if type(effect) is Lightning:
+                angle = self.rng.uniform(0, 2 * math.pi)
+                distance = self.rng.uniform(20, 120)
+                self.burst(effect.x + math.cos(angle) * distance, effect.y + math.sin(angle) * distance,
+                           2, YELLOW, 2, 10, 0)
+            elif type(effect) is EnergyOrbs:
+                for x, y in effect.orb_positions():
+                    self.burst(x, y, 1, ORANGE, 0.5, 12, 0)
+    
+    def update(self):
+        # Uma passada só: move, aplica a gravidade e descarta as que acabaram
+        xs = self.x
+        ys = self.y
+        vxs = self.vx
+        vys = self.vy
+        gravity = self.gravity
+        life = self.life
+        colors = self.color
+        count = self.count
+        i = 0
+        while i < count:
+            remaining = life[i] - 1
+            if remaining > 0:
+                life[i] = remaining
+                xs[i] += vxs[i]
+                vy = vys[i] + gravity[i]
+                vys[i] = vy
+                ys[i] += vy
+                i += 1
+                continue
+            # Remoção por troca com a última partícula viva
+            count -= 1
+            xs[i] = xs[count]
+            ys[i] = ys[count]
+            vxs[i] = vxs[count]
+            vys[i] = vys[count]
+            gravity[i] = gravity[count]
+            life[i] = life[count]
+            colors[i] = colors[count]
+        self.count = count
+    
+    def step(self):
+        # Chamado uma vez por tick depois do World.step; um nível novo (ou um
+        # snapshot restaurado) começa sem partículas
+        world = self.world
+        if world is None:
+            return
+        if world.layout_version != self.layout_version or world.restore_version != self.restore_version:
+            self.layout_version = world.layout_version
+            self.restore_version = world.restore_version
+            self.clear()
+        self.emit_effects(world.player)
+        self.update()
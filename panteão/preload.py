@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+
+# Pré-carregamento do próximo nível.
+# Enquanto o nível atual é jogado, uma thread monta o LevelBuild do próximo
+# (World.build_level) e, se houver uma StaticLayer, já desenha o cenário dele
+# numa superfície fora da tela. Quando o jogador passa pela porta, o
+# World.next_level pega o nível pronto em take() e só troca as referências.
+# Montar o nível não toca no RNG da partida, então o resultado é o mesmo
+# com ou sem pré-carregamento (e os replays continuam valendo).
+
+class LevelPreloader:
+    def __init__(self, static_layer=None):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preload")
+        self.static_layer = static_layer
+        # (world, nível, future) do pedido em andamento
+        self.pending = None
+    
+    def attach(self, world):
+        # Passa a servir este World e já pede o nível seguinte ao atual
+        world.level_source = self.take
+        self.request(world, world.level + 1)
+    
+    def request(self, world, level):
+        if level > world.max_level:
+            self.pending = None
+            return
+        self.pending = (world, level, self.executor.submit(self.build, world, level))
+    
+    def build(self, world, level):
+        build = world.build_level(level)
+        if self.static_layer:
+            self.static_layer.prepare(build)
+        return build
+    
+    def take(self, world, level):
+        pending = self.pending
+        self.pending = None
+        if pending is None or pending[0] is not world or pending[1] != level:
+            return None
+        # Normalmente já terminou há muito tempo; se não, espera o pouco que falta
+        try:
+            build = pending[2].result()
+        except Exception as e:
+            print(f"Erro ao pré-carregar o nível {level}: {e}")
+            build = None
+        self.request(world, level + 1)
+        return build
+    
+    def shutdown(self):
+        self.pending = None
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,148 @@
+import time
+from collections import deque
+
+# Instrumentação do Panteão.
+# SectionTimer soma o tempo gasto em cada seção (nomes livres, como
+# "enemy_update") envolvendo métodos e funções com cronômetros, e é usado
+# tanto pelo bench.py quanto pelo Profiler do overlay de debug.
+# O Profiler só instala os cronômetros quando é ligado (F3 no jogo) e os tira
+# quando é desligado: desligado, o código medido roda sem camada nenhuma.
+
+class NullSection:
+    # Contexto vazio devolvido por section() com o profiler desligado
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+NULL_SECTION = NullSection()
+
+class Section:
+    __slots__ = ("totals", "name", "start")
+    
+    def __init__(self, totals, name):
+        self.totals = totals
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        self.totals[self.name] = self.totals.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+class SectionTimer:
+    def __init__(self):
+        self.current = {}
+        self.patched = []
+    
+    def wrap(self, owner, name, section):
+        # Troca owner.name (método de classe ou função de módulo) por uma
+        # versão cronometrada; restore() desfaz tudo
+        original = getattr(owner, name)
+        current = self.current
+        clock = time.perf_counter
+        
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                current[section] = current.get(section, 0.0) + clock() - start
+        
+        setattr(owner, name, timed)
+        self.patched.append((owner, name, original))
+    
+    def count(self, owner, name, counter):
+        # Como wrap, mas só conta as chamadas (ex.: chamadas de desenho)
+        original = getattr(owner, name)
+        current = self.current
+        
+        def counted(*args, **kwargs):
+            current[counter] = current.get(counter, 0) + 1
+            return original(*args, **kwargs)
+        
+        setattr(owner, name, counted)
+        self.patched.append((owner, name, original))
+    
+    def section(self, name):
+        return Section(self.current, name)
+    
+    def restore(self):
+        for owner, name, original in reversed(self.patched):
+            setattr(owner, name, original)
+        self.patched = []
+    
+    def take(self):
+        values = self.current.copy()
+        self.current.clear()
+        return values
+
+class Profiler:
+    def __init__(self, history=120):
+        self.enabled = False
+        self.timer = SectionTimer()
+        # (owner, nome, seção, só_contar) instalados quando o profiler liga
+        self.targets = []
+        self.frame_times = deque(maxlen=history)
+        # Seções e contadores do último frame completo, para o overlay
+        self.last_frame = {}
+    
+    def register(self, owner, name, section):
+        self.targets.append((owner, name, section, False))
+    
+    def register_counter(self, owner, name, counter):
+        self.targets.append((owner, name, counter, True))
+    
+    def enable(self):
+        if self.enabled:
+            return
+        for owner, name, section, count_only in self.targets:
+            if count_only:
+                self.timer.count(owner, name, section)
+            else:
+                self.timer.wrap(owner, name, section)
+        self.enabled = True
+    
+    def disable(self):
+        if not self.enabled:
+            return
+        self.timer.restore()
+        self.timer.take()
+        self.frame_times.clear()
+        self.last_frame = {}
+        self.enabled = False
+    
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+    
+    def section(self, name):
+        # with profiler.section("nome"): ... para medir um trecho de código
+        if not self.enabled:
+            return NULL_SECTION
+        return self.timer.section(name)
+    
+    def timed(self, name):
+        # Decorador; desligado custa só o teste de self.enabled
+        def decorator(func):
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.timer.section(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+    
+    def end_frame(self, dt):
+        self.frame_times.append(dt)
+        self.last_frame = self.timer.take()
+    
+    def fps(self):
+        total = sum(self.frame_times)
+        return len(self.frame_times) / total if total > 0 else 0.0
@@ -0,0 +1,79 @@
+from array import array
+
+from .constants import WIDTH
+
+# Tiros dos inimigos tipo 5 e do boss.
+# Um único pool por World guarda todos os tiros em arrays paralelos
+# (x, y, direção e dano), sem uma lista por tiro. Os tiros vivos ocupam os
+# índices [0, count): um tiro que sai do nível ou acerta o jogador é trocado
+# com o último e count diminui, então nada é alocado nem removido do meio.
+
+PROJECTILE_SPEED = 5
+PROJECTILE_CAPACITY = 32
+
+class ProjectilePool:
+    def __init__(self, capacity=PROJECTILE_CAPACITY):
+        self.x = array("d", [0.0]) * capacity
+        self.y = array("d", [0.0]) * capacity
+        self.direction = array("b", [0]) * capacity
+        self.damage = array("l", [0]) * capacity
+        self.count = 0
+        # Largura do nível: tiros que passam dela somem
+        self.width = WIDTH
+    
+    def __len__(self):
+        return self.count
+    
+    def __iter__(self):
+        # Posições dos tiros vivos, para desenhar
+        xs = self.x
+        ys = self.y
+        for i in range(self.count):
+            yield xs[i], ys[i]
+    
+    def grow(self):
+        # Dobra a capacidade; só acontece nas primeiras lutas cheias de tiros
+        self.x.extend(self.x)
+        self.y.extend(self.y)
+        self.direction.extend(self.direction)
+        self.damage.extend(self.damage)
+    
+    def spawn(self, x, y, direction, damage):
+        if self.count == len(self.x):
+            self.grow()
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.direction[i] = direction
+        self.damage[i] = damage
+        self.count = i + 1
+    
+    def clear(self):
+        self.count = 0
+    
+    def update(self, player, events):
+        # Uma passada só: move, descarta os que saíram do nível e testa o jogador
+        xs = self.x
+        ys = self.y
+        directions = self.direction
+        damages = self.damage
+        rect = player.rect
+        width = self.width
+        count = self.count
+        i = 0
+        while i < count:
+            x = xs[i] + directions[i] * PROJECTILE_SPEED
+            y = ys[i]
+            if 0 <= x <= width:
+                if not (rect.x <= x < rect.x + rect.w and rect.y <= y < rect.y + rect.h):
+                    xs[i] = x
+                    i += 1
+                    continue
+                events.damage(player, damages[i])
+            # Remoção por troca com o último tiro vivo
+            count -= 1
+            xs[i] = xs[count]
+            ys[i] = ys[count]
+            directions[i] = directions[count]
+            damages[i] = damages[count]
+        self.count = count
@@ -0,0 +1,567 @@
+import math
+from collections import OrderedDict
+
+import pygame
+from pgzero import ptext
+from pgzero.rect import Rect
+from pgzero.screen import Screen
+
+from .atlas import SpriteAtlas, SpriteBatch
+from .camera import Camera
+from .particles import ParticleSystem
+from .constants import (
+    WIDTH, HEIGHT,
+    BLACK, WHITE, RED, GREEN, BLUE, BROWN, ORANGE, DARK_BLUE, GRAY,
+    YELLOW, DARK_PURPLE, GOLD, LAVA, DARK_GREEN, LIGHT_BLUE
+)
+from .spatial import Rect as SimRect
+
+# Renderização do Panteão.
+# O World não sabe desenhar: cada entidade tem aqui a sua função de desenho,
+# que lê o estado da simulação e desenha em `target` (a tela do pgzero ou
+# qualquer Screen criada sobre uma pygame.Surface). Não depende do main.py,
+# então também dá para desenhar fora do jogo, por exemplo no bench.py.
+
+def to_rect(rect):
+    return Rect(rect.x, rect.y, rect.w, rect.h)
+
+# Textos já rasterizados, por (texto, tamanho, cor), com LRU. O ptext do
+# pgzero também guarda superfícies, mas cada screen.draw.text ainda resolve
+# todos os parâmetros e monta uma chave enorme antes de achar a superfície.
+TEXT_CACHE_SIZE = 256
+TEXT_FONT_SIZE = 24
+
+class TextCache:
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+    
+    def __len__(self):
+        return len(self.surfaces)
+    
+    def get(self, text, fontsize=TEXT_FONT_SIZE, color=WHITE):
+        key = (text, fontsize, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = ptext.getsurf(text, fontsize=fontsize, color=color, cache=False)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.capacity:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+    
+    def clear(self):
+        self.surfaces.clear()
+
+text_cache = TextCache()
+
+def draw_text(text, target, pos=None, center=None, fontsize=TEXT_FONT_SIZE, color=WHITE):
+    # Como target.draw.text(text, pos ou center=..., fontsize=..., color=...)
+    surface = text_cache.get(text, fontsize, color)
+    if center:
+        pos = (int(round(center[0] - 0.5 * surface.get_width())),
+               int(round(center[1] - 0.5 * surface.get_height())))
+    target.blit(surface, pos)
+
+# Entidades: cada visual é pintado uma vez no atlas (atlas.py) e vira um blit
+# no lote do frame. As funções paint_* desenham o sprite na origem; as draw_*
+# escolhem o sprite e a posição.
+atlas = SpriteAtlas()
+sprite_batch = SpriteBatch()
+
+EYE_SIZE = 4
+BOSS_EYE_SIZE = 8
+BAR_HEIGHT = 5
+SHIELD_RADIUS = 25
+SHIELD_BAR_WIDTH = 40
+WHIP_LENGTH = 64
+WHIP_TIP = 4
+PROJECTILE_RADIUS = 5
+PARTICLE_SIZE = 3
+# Nos últimos ticks de vida a partícula fica um pixel menor
+PARTICLE_FADE_TICKS = 6
+
+def paint_body(target, width, height, color, eye_size, facing_right):
+    target.draw.filled_rect(Rect(0, 0, width, height), color)
+    eye_x = width - 10 if facing_right else 10
+    target.draw.filled_circle((eye_x, 10), eye_size, WHITE)
+    target.draw.filled_circle((eye_x, 22), eye_size, WHITE)
+
+def paint_bar(target, width, filled, color, background):
+    target.draw.filled_rect(Rect(0, 0, width, BAR_HEIGHT), background)
+    target.draw.filled_rect(Rect(0, 0, filled, BAR_HEIGHT), color)
+
+def paint_circle(target, radius, color, outline):
+    if color:
+        target.draw.filled_circle((radius, radius), radius, color)
+    if outline:
+        target.draw.circle((radius, radius), radius, outline)
+
+def paint_square(target, size, color):
+    target.draw.filled_rect(Rect(0, 0, size, size), color)
+
+def paint_whip(target, facing_right):
+    # Linha + ponta; a origem fica na altura do centro menos a ponta
+    start = 0 if facing_right else WHIP_LENGTH + WHIP_TIP
+    end = WHIP_LENGTH if facing_right else WHIP_TIP
+    target.draw.line((start, WHIP_TIP), (end, WHIP_TIP), WHITE)
+    target.draw.filled_circle((end, WHIP_TIP), WHIP_TIP, WHITE)
+
+def paint_door(target, width, height):
+    target.draw.filled_rect(Rect(0, 0, width, height), GOLD)
+    target.draw.rect(Rect(0, 0, width, height), (200, 150, 0))
+    target.draw.rect(Rect(10, 20, 30, 5), (200, 150, 0))
+    target.draw.rect(Rect(10, 40, 30, 5), (200, 150, 0))
+
+def body_sprite(width, height, color, eye_size, facing_right):
+    return atlas.sprite(width, height, paint_body, width, height, color, eye_size, facing_right)
+
+def bar_sprite(width, filled, color, background=RED):
+    return atlas.sprite(width, BAR_HEIGHT, paint_bar, width, filled, color, background)
+
+def circle_sprite(radius, color, outline=None):
+    size = radius * 2 + 1
+    return atlas.sprite(size, size, paint_circle, radius, color, outline)
+
+def draw_player(player, batch):
+    color = BLUE
+    if player.invincibility_timer > 0 and player.invincibility_timer % 5 < 3:
+        color = (100, 100, 255)
+    
+    rect = player.rect
+    x = round(rect.x)
+    y = round(rect.y)
+    batch.add(body_sprite(rect.w, rect.h, color, EYE_SIZE, player.facing_right), x, y)
+    
+    center_x = round(rect.centerx)
+    center_y = round(rect.centery)
+    if player.shielding:
+        batch.add(circle_sprite(SHIELD_RADIUS, None, (200, 200, 200)),
+                  center_x - SHIELD_RADIUS, center_y - SHIELD_RADIUS)
+        
+        # Barra de tempo do escudo
+        if player.shield_timer > 0:
+            remaining = 1.0 - (player.shield_timer / player.max_shield_time)
+            batch.add(bar_sprite(SHIELD_BAR_WIDTH, int(SHIELD_BAR_WIDTH * remaining), GREEN),
+                      center_x - SHIELD_BAR_WIDTH // 2, y - 15)
+    
+    # Chicote
+    if player.attacking:
+        whip = atlas.sprite(WHIP_LENGTH + WHIP_TIP + 1, WHIP_TIP * 2 + 1, paint_whip, player.facing_right)
+        if player.facing_right:
+            batch.add(whip, x + rect.w, center_y - WHIP_TIP)
+        else:
+            batch.add(whip, x - WHIP_LENGTH - WHIP_TIP, center_y - WHIP_TIP)
+
+def draw_player_effects(player, target, level_width=WIDTH):
+    # Laser e efeitos de habilidade mudam de tamanho a cada tick e continuam
+    # sendo primitivas, desenhadas depois do lote
+    if player.laser_active:
+        laser_width = 10
+        if player.facing_right:
+            target.draw.filled_rect(Rect(player.rect.right, player.rect.centery - laser_width//2, 
+                                       level_width - player.rect.right, laser_width), RED)
+        else:
+            target.draw.filled_rect(Rect(0, player.rect.centery - laser_width//2, 
+                                       player.rect.left, laser_width), RED)
+    
+    for effect in player.ability_effects:
+        effect.draw(target)
+
+class ShiftedScreen:
+    # Screen para quem desenha com primitivas em coordenadas do nível (cenário,
+    # laser e efeitos): desloca tudo por (offset_x, offset_y)
+    def __init__(self, target, offset_x, offset_y):
+        self.target = target
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+    
+    @property
+    def draw(self):
+        return self
+    
+    def line(self, start, end, color):
+        dx, dy = self.offset_x, self.offset_y
+        self.target.draw.line((start[0] - dx, start[1] - dy), (end[0] - dx, end[1] - dy), color)
+    
+    def circle(self, pos, radius, color):
+        self.target.draw.circle((pos[0] - self.offset_x, pos[1] - self.offset_y), radius, color)
+    
+    def filled_circle(self, pos, radius, color):
+        self.target.draw.filled_circle((pos[0] - self.offset_x, pos[1] - self.offset_y), radius, color)
+    
+    def rect(self, rect, color):
+        self.target.draw.rect(Rect(rect.x - self.offset_x, rect.y - self.offset_y, rect.w, rect.h), color)
+    
+    def filled_rect(self, rect, color):
+        self.target.draw.filled_rect(Rect(rect.x - self.offset_x, rect.y - self.offset_y, rect.w, rect.h), color)
+
+def draw_background(level, target, bounds=(WIDTH, HEIGHT)):
+    width, height = bounds
+    if level == 10:
+        target.draw.filled_rect(Rect(0, 0, width, height), DARK_PURPLE)
+        for i in range(50):
+            x = (i * 37) % width
+            y = (i * 23) % height
+            target.draw.filled_circle((x, y), 1, WHITE)
+    else:
+        target.draw.filled_rect(Rect(0, 0, width, height), DARK_BLUE)
+        # 10 nuvens por tela de largura, espalhadas pelo nível inteiro
+        for i in range(10 * width // WIDTH):
+            x = (i * 120) % width
+            y = 100 + (i * 30) % 100
+            target.draw.filled_circle((x, y), 15, WHITE)
+            target.draw.filled_circle((x+10, y-5), 12, WHITE)
+            target.draw.filled_circle((x-10, y+5), 10, WHITE)
+
+def draw_platform(platform, target):
+    if platform.is_ground:
+        target.draw.filled_rect(to_rect(platform.rect), BROWN)
+        for i in range(0, platform.rect.width, 20):
+            target.draw.line((platform.rect.x + i, platform.rect.y),
+                            (platform.rect.x + i, platform.rect.y + platform.rect.height),
+                            (100, 50, 0))
+    else:
+        target.draw.filled_rect(to_rect(platform.rect), GREEN)
+        target.draw.rect(to_rect(platform.rect), DARK_GREEN)
+
+def draw_hazard(hazard, target):
+    if hazard.type == "spikes":
+        target.draw.filled_rect(to_rect(hazard.rect), LAVA)
+        for i in range(0, hazard.rect.width, 10):
+            target.draw.line((hazard.rect.x + i, hazard.rect.y + hazard.rect.height),
+                            (hazard.rect.x + i + 5, hazard.rect.y),
+                            RED)
+
+def draw_scenery(level, platforms, hazards, target, bounds=(WIDTH, HEIGHT)):
+    draw_background(level, target, bounds)
+    
+    # Plataformas
+    for platform in platforms:
+        draw_platform(platform, target)
+    
+    # Hazards
+    for hazard in hazards:
+        draw_hazard(hazard, target)
+
+# Blocos do cenário guardados; com a câmera andando por um nível grande os
+# mais antigos são descartados e redesenhados se ela voltar
+STATIC_TILE_CACHE = 12
+PREPARED_LEVELS = 2
+
+class StaticLayer:
+    # Fundo, plataformas e hazards não se mexem: são desenhados uma vez em
+    # blocos do tamanho da tela, fora da tela, e depois só copiados com um
+    # blit por bloco visível. Um nível do tamanho da janela é um bloco só; num
+    # nível maior os blocos são desenhados quando a câmera chega neles.
+    # A camada é refeita quando o World gera um novo nível (layout_version).
+    # prepare() deixa desenhado de antemão o bloco onde o próximo nível começa.
+    def __init__(self):
+        # (coluna, linha) -> superfície, do menos para o mais usado
+        self.tiles = OrderedDict()
+        self.world = None
+        self.layout_version = None
+        # plataformas do nível -> {bloco: superfície}, desenhados por prepare().
+        # Guarda mais de um nível porque o preload.py já começa o seguinte
+        # assim que um nível entra, antes do primeiro draw dele.
+        self.prepared = {}
+    
+    def invalidate(self):
+        self.tiles = OrderedDict()
+    
+    def is_stale(self, world):
+        return self.world is not world or self.layout_version != world.layout_version
+    
+    def paint_tile(self, level, bounds, platform_grid, hazard_grid, tile):
+        # Só as plataformas e hazards que tocam o bloco, em coordenadas do nível
+        x = tile[0] * WIDTH
+        y = tile[1] * HEIGHT
+        area = SimRect(x, y, WIDTH, HEIGHT)
+        surface = pygame.Surface((WIDTH, HEIGHT))
+        target = ShiftedScreen(Screen(surface), x, y)
+        draw_scenery(level, platform_grid.query(area), hazard_grid.query(area), target, bounds)
+        return surface
+    
+    def prepare(self, build):
+        # Roda na thread do preload.py; a superfície só é convertida para o
+        # formato da tela quando o nível entra
+        x, y = build.player_start
+        tile = (int(x // WIDTH), int(y // HEIGHT))
+        surface = self.paint_tile(build.level, build.bounds, build.platform_grid, build.hazard_grid, tile)
+        self.prepared[build.platforms] = {tile: surface}
+        if len(self.prepared) > PREPARED_LEVELS:
+            self.prepared.pop(next(iter(self.prepared)), None)
+    
+    def reset(self, world):
+        self.tiles = OrderedDict()
+        prepared = self.prepared.pop(world.platforms, None)
+        if prepared:
+            for tile, surface in prepared.items():
+                self.tiles[tile] = surface.convert()
+        self.world = world
+        self.layout_version = world.layout_version
+    
+    def tile(self, world, tile):
+        surface = self.tiles.get(tile)
+        if surface is None:
+            surface = self.paint_tile(world.level, world.bounds, world.platform_grid,
+                                      world.hazard_grid, tile).convert()
+            self.tiles[tile] = surface
+            if len(self.tiles) > STATIC_TILE_CACHE:
+                self.tiles.popitem(last=False)
+        else:
+            self.tiles.move_to_end(tile)
+        return surface
+    
+    def draw(self, world, target, camera):
+        if self.is_stale(world):
+            self.reset(world)
+        for row in range(camera.y // HEIGHT, (camera.y + camera.height - 1) // HEIGHT + 1):
+            for column in range(camera.x // WIDTH, (camera.x + camera.width - 1) // WIDTH + 1):
+                target.blit(self.tile(world, (column, row)), (column * WIDTH - camera.x, row * HEIGHT - camera.y))
+
+def draw_enemy(enemy, batch):
+    color = GRAY if enemy.necromanced else enemy.color
+    eye_size = BOSS_EYE_SIZE if enemy.type == 10 else EYE_SIZE
+    
+    rect = enemy.rect
+    x = round(rect.x)
+    y = round(rect.y)
+    batch.add(body_sprite(rect.w, rect.h, color, eye_size, enemy.direction > 0), x, y)
+    
+    if enemy.health < enemy.max_health:
+        health_width = int((enemy.health / enemy.max_health) * rect.w)
+        batch.add(bar_sprite(rect.w, max(health_width, 0), GREEN), x, y - 10)
+
+def draw_projectiles(projectiles, batch, view=None):
+    sprite = circle_sprite(PROJECTILE_RADIUS, ORANGE)
+    if view is None:
+        for x, y in projectiles:
+            batch.add(sprite, int(x) - PROJECTILE_RADIUS, int(y) - PROJECTILE_RADIUS)
+        return
+    left = view.x
+    top = view.y
+    right = view.x + view.w
+    bottom = view.y + view.h
+    for x, y in projectiles:
+        if left <= x < right and top <= y < bottom:
+            batch.add(sprite, int(x) - PROJECTILE_RADIUS, int(y) - PROJECTILE_RADIUS)
+
+def draw_particles(particles, batch, view):
+    # Um sprite por (cor, tamanho), procurado no atlas uma vez por frame
+    sprites = {}
+    colors = particles.colors
+    xs = particles.x
+    ys = particles.y
+    life = particles.life
+    color = particles.color
+    left = view.x
+    top = view.y
+    right = view.x + view.w
+    bottom = view.y + view.h
+    for i in range(particles.count):
+        x = xs[i]
+        y = ys[i]
+        if left <= x < right and top <= y < bottom:
+            key = color[i] * 2 + (life[i] <= PARTICLE_FADE_TICKS)
+            sprite = sprites.get(key)
+            if sprite is None:
+                size = PARTICLE_SIZE - (key & 1)
+                sprite = atlas.sprite(size, size, paint_square, size, colors[color[i]])
+                sprites[key] = sprite
+            batch.add(sprite, int(x) - 1, int(y) - 1)
+
+def draw_orb(orb, batch):
+    if not orb.collected:
+        pulse = (math.sin(orb.animation_timer * 0.1) + 1) / 2
+        size = int(15 + pulse * 10)
+        center_x, center_y = orb.rect.center
+        batch.add(circle_sprite(size, orb.color, WHITE), round(center_x) - size, round(center_y) - size)
+
+def draw_door(door, batch):
+    rect = door.rect
+    batch.add(atlas.sprite(rect.w, rect.h, paint_door, rect.w, rect.h), round(rect.x), round(rect.y))
+
+# Acima dessa distância num único tick a entidade teleportou (boss, inimigo
+# tipo 4) e é desenhada direto na posição nova, sem passar pelo meio do caminho.
+SNAP_DISTANCE = 64
+
+class Interpolation:
+    # Posições do jogador e dos inimigos antes do último World.step do frame.
+    # apply() leva cada rect para prev + (atual - prev) * alpha só enquanto a
+    # tela é desenhada; restore() devolve as posições reais da simulação.
+    def __init__(self):
+        self.previous = {}
+        self.world = None
+        self.layout_version = None
+        self.restore_version = None
+    
+    def capture(self, world):
+        previous = {}
+        for entity in [world.player] + world.enemies:
+            previous[id(entity)] = (entity, entity.rect.x, entity.rect.y)
+        self.previous = previous
+        self.world = world
+        self.layout_version = world.layout_version
+        self.restore_version = world.restore_version
+    
+    def apply(self, world, alpha):
+        moved = []
+        # Nível novo, snapshot restaurado ou outra partida: nada para interpolar
+        if (world is not self.world or world.layout_version != self.layout_version
+                or world.restore_version != self.restore_version):
+            return moved
+        previous = self.previous
+        for entity in [world.player] + world.enemies:
+            entry = previous.get(id(entity))
+            if entry is None or entry[0] is not entity:
+                continue
+            rect = entity.rect
+            x, y = rect.x, rect.y
+            dx = x - entry[1]
+            dy = y - entry[2]
+            if dx == 0 and dy == 0 or abs(dx) > SNAP_DISTANCE or abs(dy) > SNAP_DISTANCE:
+                continue
+            moved.append((rect, x, y))
+            rect.x = entry[1] + dx * alpha
+            rect.y = entry[2] + dy * alpha
+        return moved
+    
+    def restore(self, moved):
+        for rect, x, y in moved:
+            rect.x = x
+            rect.y = y
+
+class HudLabel:
+    # Texto do HUD que só é rasterizado de novo quando o valor muda
+    __slots__ = ("template", "pos", "color", "value", "surface")
+    
+    def __init__(self, template, pos, color=WHITE):
+        self.template = template
+        self.pos = pos
+        self.color = color
+        self.value = None
+        self.surface = None
+    
+    def draw(self, value, target):
+        if value != self.value:
+            self.value = value
+            self.surface = text_cache.get(self.template.format(*value), TEXT_FONT_SIZE, self.color)
+        target.blit(self.surface, self.pos)
+
+class Hud:
+    def __init__(self):
+        self.health = HudLabel("HP: {}/{}", (15, 12))
+        self.mana = HudLabel("MP: {}/{}", (15, 42))
+        self.level = HudLabel("NÍVEL: {}", (700, 10))
+        self.ability = HudLabel("HABILIDADE: {}", (10, 70), YELLOW)
+    
+    def draw(self, world, target):
+        player = world.player
+        target.draw.filled_rect(Rect(10, 10, 200, 20), BLACK)
+        target.draw.filled_rect(Rect(10, 10, int(200 * (player.health / player.max_health)), 20), RED)
+        self.health.draw((int(player.health), player.max_health), target)
+        
+        target.draw.filled_rect(Rect(10, 40, 200, 20), BLACK)
+        target.draw.filled_rect(Rect(10, 40, int(200 * (player.mana / player.max_mana)), 20), BLUE)
+        self.mana.draw((int(player.mana), player.max_mana), target)
+        
+        self.level.draw((world.level,), target)
+        
+        if player.collected_ability:
+            self.ability.draw((player.collected_ability.upper(),), target)
+
+# Câmera do desenho: segue a posição interpolada do jogador, enquanto a do
+# World (que decide quem dorme) segue a posição do tick
+camera = Camera()
+# Partículas do World ligado (Game.start_run chama particles.attach)
+particles = ParticleSystem()
+# Entidades até essa distância fora da tela ainda são desenhadas (olhos,
+# barras de vida e chicote passam do rect)
+CULL_MARGIN = 64
+
+def draw_world(world, target, static_layer, hud):
+    player = world.player
+    camera.follow(player.rect, *world.bounds)
+    
+    # Fundo, plataformas e hazards
+    static_layer.draw(world, target, camera)
+    
+    # Porta, orbes, inimigos, tiros e jogador num lote só; só o que está
+    # perto da tela entra
+    view = camera.view(CULL_MARGIN)
+    batch = sprite_batch
+    batch.offset_x = camera.x
+    batch.offset_y = camera.y
+    if world.door and view.colliderect(world.door.rect):
+        draw_door(world.door, batch)
+    
+    for orb in world.ability_orbs:
+        if view.colliderect(orb.rect):
+            draw_orb(orb, batch)
+    
+    for enemy in world.enemies:
+        if view.colliderect(enemy.rect):
+            draw_enemy(enemy, batch)
+    
+    draw_projectiles(world.projectiles, batch, view)
+    
+    draw_player(player, batch)
+    if particles.world is world:
+        draw_particles(particles, batch, view)
+    batch.flush(target)
+    
+    effects_target = target
+    if camera.x or camera.y:
+        effects_target = ShiftedScreen(target, camera.x, camera.y)
+    draw_player_effects(player, effects_target, world.bounds[0])
+    
+    # UI
+    hud.draw(world, target)
+
+# Overlay de debug (F3): FPS, gráfico do tempo de frame, contagens e as
+# seções medidas pelo Profiler no último frame.
+OVERLAY_X = 540
+OVERLAY_Y = 40
+OVERLAY_WIDTH = 250
+GRAPH_HEIGHT = 50
+# Linha de referência do gráfico: um frame a 60 FPS
+FRAME_BUDGET_MS = 1000 / 60
+
+def draw_profiler_overlay(profiler, world, target):
+    sections = profiler.last_frame
+    timed = sorted((name, value) for name, value in sections.items() if isinstance(value, float))
+    height = 126 + len(timed) * 14
+    target.draw.filled_rect(Rect(OVERLAY_X, OVERLAY_Y, OVERLAY_WIDTH, height), (0, 0, 0))
+    target.draw.rect(Rect(OVERLAY_X, OVERLAY_Y, OVERLAY_WIDTH, height), GRAY)
+    
+    x = OVERLAY_X + 8
+    y = OVERLAY_Y + 6
+    target.draw.text(f"FPS: {profiler.fps():.1f}", (x, y), fontsize=18, color=WHITE)
+    
+    # Gráfico: uma barra por frame, da esquerda (mais antigo) para a direita
+    graph_bottom = y + 20 + GRAPH_HEIGHT
+    scale = GRAPH_HEIGHT / (FRAME_BUDGET_MS * 2)
+    spacing = (OVERLAY_WIDTH - 16) / profiler.frame_times.maxlen
+    for i, dt in enumerate(profiler.frame_times):
+        ms = dt * 1000
+        bar = min(GRAPH_HEIGHT, ms * scale)
+        color = GREEN if ms <= FRAME_BUDGET_MS * 1.1 else (YELLOW if ms <= FRAME_BUDGET_MS * 2 else RED)
+        bar_x = x + i * spacing
+        target.draw.line((bar_x, graph_bottom), (bar_x, graph_bottom - bar), color)
+    budget_y = graph_bottom - FRAME_BUDGET_MS * scale
+    target.draw.line((x, budget_y), (x + OVERLAY_WIDTH - 16, budget_y), GRAY)
+    
+    y = graph_bottom + 6
+    if world:
+        counts = (f"inimigos: {len(world.enemies)}  tiros: {len(world.projectiles)}  "
+                  f"efeitos: {len(world.player.ability_effects)}")
+        target.draw.text(counts, (x, y), fontsize=16, color=WHITE)
+    y += 16
+    target.draw.text(f"chamadas de desenho: {sections.get('draw_calls', 0)}  partículas: {len(particles)}",
+                     (x, y), fontsize=16, color=WHITE)
+    y += 22
+    for name, value in timed:
+        target.draw.text(f"{name}: {value * 1000:.2f} ms", (x, y), fontsize=16, color=LIGHT_BLUE)
+        y += 14
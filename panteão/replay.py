@@ -0,0 +1,109 @@
+import json
+import sys
+
+from .world import World
+
+# Gravação e reprodução de partidas.
+# Um replay guarda a semente do World, o nível inicial e só os ticks em que
+# houve comando, com cada comando reduzido a uma letra:
+#   {"version": 4, "seed": 123, "level": 1, "transition_ticks": 60,
+#    "ticks": 4210, "inputs": [[0, "r"], [12, "j"], [40, "sa"], ...]}
+# Como o World é determinístico, reaplicar os mesmos comandos nos mesmos
+# ticks reproduz a partida bit a bit, sem tela e na velocidade máxima.
+
+REPLAY_VERSION = 4
+
+COMMAND_CODES = {
+    "left": "l",
+    "right": "r",
+    "stop": "s",
+    "jump": "j",
+    "attack": "a",
+    "shield": "k",
+    "stop_shield": "u",
+    "ability": "h"
+}
+CODE_COMMANDS = {code: command for command, code in COMMAND_CODES.items()}
+
+class ReplayRecorder:
+    def __init__(self, seed, level=1, transition_ticks=60):
+        self.seed = seed
+        self.level = level
+        self.transition_ticks = transition_ticks
+        self.inputs = []
+        self.ticks = 0
+    
+    def record(self, tick, inputs):
+        # Chamado antes de World.step com o World.ticks daquele momento
+        if inputs:
+            self.inputs.append([tick, "".join(COMMAND_CODES[command] for command in inputs)])
+        self.ticks = tick + 1
+    
+    def to_dict(self):
+        return {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "level": self.level,
+            "transition_ticks": self.transition_ticks,
+            "ticks": self.ticks,
+            "inputs": self.inputs
+        }
+    
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+class Replay:
+    def __init__(self, seed, level=1, ticks=0, inputs=(), transition_ticks=60):
+        self.seed = seed
+        self.level = level
+        self.transition_ticks = transition_ticks
+        self.ticks = ticks
+        self.inputs = {}
+        for tick, codes in inputs:
+            self.inputs[tick] = [CODE_COMMANDS[code] for code in codes]
+    
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Versão de replay não suportada: {data.get('version')}")
+        return cls(data["seed"], data["level"], data["ticks"], data["inputs"],
+                   data.get("transition_ticks", 60))
+    
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+    
+    def inputs_for(self, tick):
+        return self.inputs.get(tick, ())
+    
+    def new_world(self):
+        world = World(level=self.level, seed=self.seed)
+        world.transition_ticks = self.transition_ticks
+        return world
+    
+    def play(self, world=None, on_tick=None):
+        # Avanço rápido: roda todos os ticks gravados sem tela nem som
+        if world is None:
+            world = self.new_world()
+        while world.state == "playing" and world.ticks < self.ticks:
+            world.step(self.inputs_for(world.ticks))
+            world.pop_sound_events()
+            if on_tick:
+                on_tick(world)
+        return world
+
+def main(argv):
+    if len(argv) != 1:
+        print("Uso: python -m panteão.replay arquivo_do_replay.json")
+        return 2
+    replay = Replay.load(argv[0])
+    world = replay.play()
+    player = world.player
+    print(f"seed={replay.seed} ticks={world.ticks}/{replay.ticks} estado={world.state} "
+          f"nível={world.level} hp={player.health:.1f} x={player.rect.x:.2f} y={player.rect.y:.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,153 @@
+from .spatial import Rect
+from .effects import EffectPool
+
+# Snapshots do World.
+# Um WorldSnapshot guarda o estado mutável da partida num tick: jogador (com
+# os efeitos de habilidade), inimigos, tiros, orbes, porta, timers do World e
+# o estado do RNG. restore() põe tudo de volta no mesmo World em objetos
+# novos, sem montar o nível de novo, e a partida continua exatamente como
+# continuaria a partir daquele tick (com os mesmos comandos).
+#
+# O que não muda durante a partida (plataformas, hazards e as grades deles,
+# compartilhados entre Worlds, ver world.level_entities) é guardado por
+# referência. Hitboxes e eventos de combate só existem dentro de um tick, então
+# um snapshot tirado entre dois World.step não precisa deles; os sons pedidos
+# antes do snapshot não são guardados.
+#
+# O World tira um snapshot no começo de cada nível (World.level_start) e pode
+# tirar outros a cada checkpoint_interval ticks (World.checkpoint).
+
+# Atributos que apontam para objetos do World e são religados no restore
+WORLD_REFERENCES = ("rng", "projectiles", "hitboxes")
+
+_slot_names = {}
+
+def slot_names(cls):
+    # Todos os __slots__ da classe e das bases (os efeitos usam __slots__)
+    names = _slot_names.get(cls)
+    if names is None:
+        names = []
+        for base in reversed(cls.__mro__):
+            names.extend(getattr(base, "__slots__", ()))
+        _slot_names[cls] = names
+    return names
+
+def copy_value(value):
+    # Rects e listas são mutados no lugar durante a partida
+    if type(value) is Rect:
+        return Rect(value.x, value.y, value.w, value.h)
+    if type(value) is list:
+        return list(value)
+    return value
+
+def copy_state(state, skip=()):
+    return {name: copy_value(value) for name, value in state.items() if name not in skip}
+
+def capture_object(obj, skip=()):
+    return type(obj), copy_state(obj.__dict__, skip)
+
+def restore_object(captured):
+    cls, state = captured
+    obj = cls.__new__(cls)
+    obj.__dict__.update(copy_state(state))
+    return obj
+
+class WorldSnapshot:
+    __slots__ = ("level", "ticks", "state", "rng_state", "batch_state", "bounds", "platforms",
+                 "hazards", "platform_grid", "hazard_grid", "door", "ability_choices", "transitioning",
+                 "transition_timer", "player", "effects", "necromanced", "enemies", "orbs",
+                 "projectiles")
+    
+    def __init__(self, world):
+        self.level = world.level
+        self.ticks = world.ticks
+        self.state = world.state
+        self.rng_state = world.rng.getstate()
+        self.batch_state = None
+        if world.enemy_batch:
+            # No motor em lote os arrays são a fonte da verdade (ver enemy_batch.py)
+            world.enemy_batch.sync()
+            self.batch_state = world.enemy_batch.random.bit_generator.state
+        self.bounds = world.bounds
+        self.platforms = world.platforms
+        self.hazards = world.hazards
+        self.platform_grid = world.platform_grid
+        self.hazard_grid = world.hazard_grid
+        self.door = world.door
+        self.ability_choices = list(world.ability_choices)
+        self.transitioning = world.transitioning
+        self.transition_timer = world.transition_timer
+        
+        player = world.player
+        self.player = capture_object(player, ("ability_effects", "necromanced_enemies", "sound_events") + WORLD_REFERENCES)
+        self.effects = [(type(effect), [getattr(effect, name) for name in slot_names(type(effect))])
+                        for effect in player.ability_effects]
+        self.enemies = [capture_object(enemy, WORLD_REFERENCES) for enemy in world.enemies]
+        # Inimigos revividos guardados pela posição na lista do World
+        index = {id(enemy): i for i, enemy in enumerate(world.enemies)}
+        self.necromanced = [index[id(enemy)] for enemy in player.necromanced_enemies if id(enemy) in index]
+        self.orbs = [capture_object(orb) for orb in world.ability_orbs]
+        
+        pool = world.projectiles
+        count = pool.count
+        self.projectiles = (count, pool.x[:count], pool.y[:count], pool.direction[:count], pool.damage[:count])
+    
+    def restore(self, world):
+        world.level = self.level
+        world.ticks = self.ticks
+        world.state = self.state
+        world.rng.setstate(self.rng_state)
+        if self.batch_state is not None and world.enemy_batch:
+            world.enemy_batch.random.bit_generator.state = self.batch_state
+        if world.platforms is not self.platforms:
+            # Snapshot de outro nível: o cenário muda de verdade
+            world.layout_version += 1
+        world.bounds = self.bounds
+        world.platforms = self.platforms
+        world.hazards = self.hazards
+        world.platform_grid = self.platform_grid
+        world.hazard_grid = self.hazard_grid
+        world.door = self.door
+        world.ability_choices = list(self.ability_choices)
+        world.transitioning = self.transitioning
+        world.transition_timer = self.transition_timer
+        # Sons já tocados não tocam de novo
+        world.sound_events = []
+        world.hitboxes.clear()
+        world.events.clear()
+        
+        enemies = []
+        for captured in self.enemies:
+            enemy = restore_object(captured)
+            enemy.rng = world.rng
+            enemy.projectiles = world.projectiles
+            enemy.hitboxes = world.hitboxes
+            enemies.append(enemy)
+        world.enemies = enemies
+        world.enemy_grid.rebuild(enemies)
+        world.enemy_grid_dirty = False
+        world.ability_orbs = [restore_object(captured) for captured in self.orbs]
+        
+        player = restore_object(self.player)
+        player.hitboxes = world.hitboxes
+        player.sound_events = []
+        player.necromanced_enemies = [enemies[i] for i in self.necromanced]
+        player.ability_effects = EffectPool()
+        for cls, values in self.effects:
+            effect = cls.__new__(cls)
+            for name, value in zip(slot_names(cls), values):
+                setattr(effect, name, copy_value(value))
+            player.ability_effects.active.append(effect)
+        world.player = player
+        
+        pool = world.projectiles
+        count, xs, ys, directions, damages = self.projectiles
+        pool.clear()
+        pool.width = self.bounds[0]
+        for i in range(count):
+            pool.spawn(xs[i], ys[i], directions[i], damages[i])
+        
+        # Objetos novos: interpolação e partículas começam de novo. O cenário é
+        # o mesmo, então o cache dele (layout_version) continua valendo
+        world.restore_version += 1
+        world.camera.follow(player.rect, *world.bounds)
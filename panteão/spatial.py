@@ -0,0 +1,262 @@
+from bisect import bisect_left, bisect_right
+
+# Geometria da simulação: o Rect usado por todas as entidades, a grade
+# espacial uniforme (inimigos, que se movem) e o sweep-and-prune em x
+# (plataformas e hazards, que não se movem) para as consultas de colisão do
+# World.
+
+class Rect:
+    # Retângulo com coordenadas float e a mesma semântica de colisão do
+    # ZRect do pgzero, para a simulação não depender do pygame.
+    __slots__ = ("x", "y", "w", "h")
+    
+    def __init__(self, x, y, w, h):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+    
+    def __repr__(self):
+        return f"Rect({self.x}, {self.y}, {self.w}, {self.h})"
+    
+    @property
+    def width(self):
+        return self.w
+    
+    @width.setter
+    def width(self, value):
+        self.w = value
+    
+    @property
+    def height(self):
+        return self.h
+    
+    @height.setter
+    def height(self, value):
+        self.h = value
+    
+    @property
+    def left(self):
+        return self.x
+    
+    @left.setter
+    def left(self, value):
+        self.x = value
+    
+    @property
+    def right(self):
+        return self.x + self.w
+    
+    @right.setter
+    def right(self, value):
+        self.x = value - self.w
+    
+    @property
+    def top(self):
+        return self.y
+    
+    @top.setter
+    def top(self, value):
+        self.y = value
+    
+    @property
+    def bottom(self):
+        return self.y + self.h
+    
+    @bottom.setter
+    def bottom(self, value):
+        self.y = value - self.h
+    
+    @property
+    def centerx(self):
+        return self.x + self.w / 2
+    
+    @centerx.setter
+    def centerx(self, value):
+        self.x = value - self.w / 2
+    
+    @property
+    def centery(self):
+        return self.y + self.h / 2
+    
+    @centery.setter
+    def centery(self, value):
+        self.y = value - self.h / 2
+    
+    @property
+    def center(self):
+        return (self.x + self.w / 2, self.y + self.h / 2)
+    
+    def colliderect(self, other):
+        return (
+            self.x < other.x + other.w and
+            self.y < other.y + other.h and
+            self.x + self.w > other.x and
+            self.y + self.h > other.y
+        )
+    
+    def collidepoint(self, x, y):
+        return self.x <= x < self.x + self.w and self.y <= y < self.y + self.h
+
+# Grade espacial: cada item precisa ter um atributo `rect`. A grade guarda o
+# item em todas as células que o rect toca; query(rect) só olha essas células,
+# então o custo depende de quantos itens estão por perto e não do total do nível.
+CELL_SIZE = 128
+# Com poucos itens varrer a lista sai mais barato que consultar as células
+LINEAR_SCAN_LIMIT = 16
+
+class SpatialGrid:
+    def __init__(self, items=(), cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        # id(item) -> [ordem de inserção, item, células ocupadas]
+        self.entries = {}
+        self.counter = 0
+        for item in items:
+            self.insert(item)
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def __contains__(self, item):
+        return id(item) in self.entries
+    
+    def cells_for(self, rect):
+        size = self.cell_size
+        x0 = int(rect.x // size)
+        y0 = int(rect.y // size)
+        x1 = int((rect.x + rect.w) // size)
+        y1 = int((rect.y + rect.h) // size)
+        if x0 == x1 and y0 == y1:
+            return ((x0, y0),)
+        cells = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cells.append((cx, cy))
+        return tuple(cells)
+    
+    def clear(self):
+        self.cells = {}
+        self.entries = {}
+        self.counter = 0
+    
+    def rebuild(self, items):
+        self.clear()
+        for item in items:
+            self.insert(item)
+    
+    def insert(self, item):
+        cells = self.cells_for(item.rect)
+        self.entries[id(item)] = [self.counter, item, cells]
+        self.counter += 1
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                self.cells[cell] = [item]
+            else:
+                bucket.append(item)
+    
+    def remove(self, item):
+        entry = self.entries.pop(id(item), None)
+        if entry is None:
+            return
+        for cell in entry[2]:
+            bucket = self.cells[cell]
+            bucket.remove(item)
+            if not bucket:
+                del self.cells[cell]
+    
+    def move(self, item):
+        # Atualização incremental: só mexe nas células se o item trocou de célula
+        entry = self.entries.get(id(item))
+        if entry is None:
+            self.insert(item)
+            return
+        cells = self.cells_for(item.rect)
+        if cells == entry[2]:
+            return
+        for cell in entry[2]:
+            bucket = self.cells[cell]
+            bucket.remove(item)
+            if not bucket:
+                del self.cells[cell]
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                self.cells[cell] = [item]
+            else:
+                bucket.append(item)
+        entry[2] = cells
+    
+    def query(self, rect):
+        # Itens cujo rect colide com `rect`, na ordem em que foram inseridos
+        # (a resolução de colisão depende da ordem, igual à das listas).
+        if len(self.entries) <= LINEAR_SCAN_LIMIT:
+            return [entry[1] for entry in self.entries.values() if rect.colliderect(entry[1].rect)]
+        found = {}
+        cells = self.cells
+        for cell in self.cells_for(rect):
+            bucket = cells.get(cell)
+            if bucket is None:
+                continue
+            for item in bucket:
+                key = id(item)
+                if key not in found and rect.colliderect(item.rect):
+                    found[key] = item
+        if len(found) < 2:
+            return list(found.values())
+        entries = self.entries
+        return sorted(found.values(), key=lambda item: entries[id(item)][0])
+
+# Sweep-and-prune para itens que não se movem (plataformas e hazards): eles
+# são ordenados uma vez pela borda esquerda e query acha por busca binária a
+# faixa dos que podem cruzar o rect em x, então uma consulta custa log(n) mais
+# os vizinhos, mesmo com um rect comprido (um corpo caindo rápido varre uma
+# coluna inteira, que na grade passaria por várias células).
+# Itens mais largos que WIDE_ITEM (o chão ocupa o nível inteiro) alargariam
+# essa faixa para todos; eles ficam numa lista à parte, testada sempre.
+WIDE_ITEM = 400
+
+class SweepAndPrune:
+    def __init__(self, items=()):
+        items = tuple(items)
+        self.items = items
+        # Ordem de inserção, para query devolver na mesma ordem da grade
+        self.order = {id(item): i for i, item in enumerate(items)}
+        self.wide = [item for item in items if item.rect.w > WIDE_ITEM]
+        narrow = sorted((item for item in items if item.rect.w <= WIDE_ITEM), key=lambda item: item.rect.x)
+        self.sorted = narrow
+        self.lefts = [item.rect.x for item in narrow]
+        self.max_width = max((item.rect.w for item in narrow), default=0)
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __iter__(self):
+        return iter(self.items)
+    
+    def query(self, rect):
+        return self.query_box(rect.x, rect.y, rect.w, rect.h)
+    
+    def query_box(self, x, y, w, h):
+        # Itens que colidem com a caixa, na ordem em que foram inseridos. Só
+        # os que começam antes da borda direita da caixa e depois de (borda
+        # esquerda - maior largura) podem cruzar ela em x
+        right = x + w
+        bottom = y + h
+        found = []
+        for item in self.wide:
+            other = item.rect
+            if x < other.x + other.w and y < other.y + other.h and right > other.x and bottom > other.y:
+                found.append(item)
+        lo = bisect_right(self.lefts, x - self.max_width)
+        hi = bisect_left(self.lefts, right)
+        if lo < hi:
+            for item in self.sorted[lo:hi]:
+                other = item.rect
+                if x < other.x + other.w and y < other.y + other.h and right > other.x and bottom > other.y:
+                    found.append(item)
+            if len(found) > 1:
+                order = self.order
+                found.sort(key=lambda item: order[id(item)])
+        return found
@@ -0,0 +1,40 @@
+# Passo fixo da simulação.
+# Toda a física do World conta em ticks (gravidade 0.8 por tick, escudo de
+# 300 ticks...), então o jogo só tem a velocidade certa com 60 ticks por
+# segundo. O FixedTimestep acumula o dt real de cada frame e diz quantos
+# ticks rodar; o que sobra no acumulador vira o alpha usado para interpolar
+# as posições na hora de desenhar.
+
+SIMULATION_RATE = 60
+# Máximo de ticks de recuperação por frame. Depois de um travamento o tempo
+# excedente é descartado (o jogo fica lento por um instante) em vez de rodar
+# cada vez mais ticks por frame e nunca alcançar o relógio.
+MAX_CATCHUP_STEPS = 5
+
+class FixedTimestep:
+    def __init__(self, rate=SIMULATION_RATE, max_steps=MAX_CATCHUP_STEPS):
+        self.step = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        # Tempo total jogado fora pelo limite de recuperação (para diagnóstico)
+        self.dropped = 0.0
+    
+    def advance(self, dt):
+        self.accumulator += dt
+        steps = 0
+        while self.accumulator >= self.step and steps < self.max_steps:
+            self.accumulator -= self.step
+            steps += 1
+        if self.accumulator >= self.step:
+            excess = self.accumulator - self.accumulator % self.step
+            self.dropped += excess
+            self.accumulator -= excess
+        return steps
+    
+    @property
+    def alpha(self):
+        # Fração do próximo tick já decorrida, entre 0 e 1
+        return min(1.0, self.accumulator / self.step)
+    
+    def reset(self):
+        self.accumulator = 0.0
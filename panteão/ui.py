@@ -0,0 +1,60 @@
+import time
+
+# Interface em modo retido para as telas paradas (menu, pausa e game over).
+# Nessas telas nada se mexe sozinho: a tela é desenhada inteira uma vez quando
+# a cena muda e, nos frames seguintes, só os widgets marcados como sujos (hover
+# de um botão, texto de um botão de opção) são redesenhados por cima, no mesmo
+# lugar. Sem mudança nenhuma o frame anterior continua na tela e o draw não
+# desenha nada.
+#
+# Um widget é qualquer objeto com rect, dirty e draw() que cubra o próprio
+# rect por inteiro (como o Button do main.py).
+
+# Depois de IDLE_FRAMES frames sem nada sujo, os widgets só são conferidos a
+# IDLE_FPS; nos outros frames o draw volta na hora sem olhar nada
+IDLE_FRAMES = 30
+IDLE_FPS = 20
+
+class RetainedScreen:
+    def __init__(self):
+        # Cena desenhada inteira por último (None = tela animada)
+        self.scene = None
+        self.surface = None
+        self.idle_frames = 0
+        self.last_frame = 0.0
+    
+    def begin(self, scene, surface):
+        # True quando a tela precisa ser desenhada inteira neste frame
+        if scene is None or scene != self.scene or surface is not self.surface:
+            self.scene = scene
+            self.surface = surface
+            self.idle_frames = 0
+            return True
+        return False
+    
+    def redraw(self, widgets):
+        # Redesenha só os widgets sujos; devolve os rects redesenhados
+        rects = []
+        for widget in widgets:
+            if widget.dirty:
+                widget.draw()
+                rects.append(widget.rect)
+        if rects:
+            self.idle_frames = 0
+        else:
+            self.idle_frames += 1
+        return rects
+    
+    @property
+    def idle(self):
+        return self.scene is not None and self.idle_frames >= IDLE_FRAMES
+    
+    def throttle(self):
+        # True quando o frame pode ser pulado: com a tela parada, só redesenha
+        # depois de 1 / IDLE_FPS desde o último redesenho. Não dorme, para não
+        # travar os eventos nem brigar com o relógio do pgzero
+        now = time.perf_counter()
+        if self.idle and now - self.last_frame < 1 / IDLE_FPS:
+            return True
+        self.last_frame = now
+        return False
@@ -0,0 +1,996 @@
+import math
+import random
+import threading
+
+from .constants import (
+    WIDTH, HEIGHT, PLAYER_SIZE,
+    WHITE, RED, GREEN, BLUE, PURPLE, ORANGE, GRAY, YELLOW, DARK_RED, CYAN,
+    LIGHT_BLUE, PINK
+)
+from .effects import EffectPool, BigFireball, EnergyWave, Lightning, EnergyOrbs, PainSpikes
+from .spatial import Rect, SpatialGrid, SweepAndPrune
+from .collision import move_y
+from .projectiles import ProjectilePool
+from .hitboxes import HitboxSystem, TARGET_ENEMIES, TARGET_PLAYER
+from .events import EventQueue, DAMAGE, DEATH, NECROMANCY
+from .snapshot import WorldSnapshot
+from .levels import compile_level, spawn_plan
+from .camera import Camera
+
+# Núcleo de simulação do Panteão.
+# Este módulo não importa pgzero, pygame nem nada de áudio: ele só avança o
+# estado do jogo. A renderização e o som ficam a cargo de main.py, que lê o
+# estado do World e toca os sons enfileirados em World.pop_sound_events().
+# As colisões passam pelos broadphases do World (ver spatial.py):
+# `platforms` e `hazards` recebidos por Player/Enemy são SweepAndPrune, e a
+# queda e o pulo contra as plataformas são varridos, para nada atravessar uma
+# plataforma entre um tick e outro (ver collision.py).
+# O dano é declarado em hitboxes durante o update e resolvido numa passada
+# só por World.resolve_hits (ver hitboxes.py), que enfileira os acertos para
+# World.process_events aplicar (ver events.py).
+# O nível pode ser maior que a tela (World.bounds); inimigos longe da área da
+# câmera dormem e não são atualizados (ver World.update_enemies).
+
+# Comandos aceitos por World.step
+INPUT_COMMANDS = ("left", "right", "stop", "jump", "attack", "shield", "stop_shield", "ability")
+
+# Folga em volta da área da câmera dentro da qual os inimigos continuam
+# acordados. Maior que o alcance de aggro de qualquer inimigo menos meia tela,
+# então ninguém que poderia perseguir o jogador está dormindo.
+SLEEP_MARGIN = 256
+
+class Player:
+    def __init__(self, x, y, hitboxes=None):
+        self.rect = Rect(x, y, PLAYER_SIZE, PLAYER_SIZE)
+        self.velocity_x = 0
+        self.velocity_y = 0
+        self.speed = 5
+        self.jump_power = -15
+        self.gravity = 0.8
+        self.is_jumping = False
+        self.health = 100
+        self.max_health = 100
+        self.mana = 100
+        self.max_mana = 100
+        self.mana_regen = 0.5
+        self.facing_right = True
+        self.animation_frame = 0
+        self.animation_timer = 0
+        self.attacking = False
+        self.shielding = False
+        self.shield_timer = 0
+        self.max_shield_time = 300
+        self.shield_cooldown = 0
+        self.max_shield_cooldown = 300
+        self.attack_timer = 0
+        self.attack_rect = None
+        self.invincibility_timer = 0
+        self.hit_cooldown = 30
+        self.collected_ability = None
+        self.ability_cooldown = 0
+        self.ability_active = False
+        self.ability_timer = 0
+        self.laser_active = False
+        self.laser_duration = 0
+        self.necromanced_enemies = []
+        self.ability_effects = EffectPool()
+        self.hitboxes = hitboxes if hitboxes is not None else HitboxSystem()
+        # Largura e altura do nível, para não sair dele
+        self.bounds = (WIDTH, HEIGHT)
+        # Sons pedidos durante o tick; o World repassa para quem estiver tocando
+        self.sound_events = []
+    
+    def emit_sound(self, sound_name, volume=1.0):
+        self.sound_events.append((sound_name, volume))
+    
+    def update(self, platforms, hazards, enemies):
+        self.velocity_y += self.gravity
+        self.check_collisions(platforms, hazards)
+        
+        if self.mana < self.max_mana and not self.laser_active:
+            self.mana += self.mana_regen
+            if self.mana > self.max_mana:
+                self.mana = self.max_mana
+        
+        if self.shielding:
+            self.shield_timer += 1
+            if self.shield_timer >= self.max_shield_time:
+                self.stop_shield()
+                self.shield_cooldown = self.max_shield_cooldown
+        
+        if self.shield_cooldown > 0:
+            self.shield_cooldown -= 1
+        
+        self.animation_timer += 1
+        if self.animation_timer >= 10:
+            self.animation_frame = (self.animation_frame + 1) % 4
+            self.animation_timer = 0
+        
+        if self.attacking:
+            self.attack_timer += 1
+            if self.attack_timer > 15:
+                self.attacking = False
+                self.attack_timer = 0
+                self.attack_rect = None
+        
+        if self.ability_cooldown > 0:
+            self.ability_cooldown -= 1
+        
+        if self.ability_active:
+            self.ability_timer -= 1
+            if self.ability_timer <= 0:
+                self.ability_active = False
+                if self.collected_ability == "necromancer":
+                    self.necromanced_enemies = []
+        
+        if self.laser_active:
+            self.laser_duration += 1
+            self.mana -= 0.1
+            if self.mana <= 0:
+                self.laser_active = False
+                self.mana = 0
+        
+        if self.invincibility_timer > 0:
+            self.invincibility_timer -= 1
+        
+        # Atualizar efeitos de habilidade
+        self.ability_effects.update()
+        
+        # Hitboxes deste tick: chicote e efeitos de habilidade
+        self.update_attack_rect()
+        if self.attack_rect:
+            self.hitboxes.declare(self, self.attack_rect, 50, TARGET_ENEMIES)
+        for effect in self.ability_effects:
+            effect.declare_hitboxes(self.hitboxes)
+    
+    def check_collisions(self, platforms, hazards):
+        # Primeiro em x, livre (as plataformas não bloqueiam de lado), depois
+        # em y com varredura (ver collision.py)
+        self.rect.x += self.velocity_x
+        if move_y(self.rect, self.velocity_y, platforms):
+            if self.velocity_y > 0:
+                self.is_jumping = False
+            self.velocity_y = 0
+        
+        for hazard in hazards.query(self.rect):
+            if self.rect.colliderect(hazard.rect):
+                if self.shielding:
+                    self.take_damage(3)
+                else:
+                    self.take_damage(10)
+                if self.velocity_y > 0:
+                    self.velocity_y = -10
+        
+        width, height = self.bounds
+        if self.rect.left < 0:
+            self.rect.left = 0
+        if self.rect.right > width:
+            self.rect.right = width
+        if self.rect.bottom > height:
+            self.rect.bottom = height
+            self.velocity_y = 0
+            self.is_jumping = False
+    
+    def jump(self):
+        if not self.is_jumping:
+            self.velocity_y = self.jump_power
+            self.is_jumping = True
+            self.emit_sound('jump', 0.7)
+    
+    def move_left(self):
+        self.velocity_x = -self.speed
+        self.facing_right = False
+    
+    def move_right(self):
+        self.velocity_x = self.speed
+        self.facing_right = True
+    
+    def stop(self):
+        self.velocity_x = 0
+    
+    def attack(self):
+        if not self.attacking:
+            self.attacking = True
+            self.attack_timer = 0
+            self.attack_rect = None
+            self.emit_sound('attack', 0.8)
+    
+    def update_attack_rect(self):
+        # Área do chicote a partir da posição atual; era calculada no desenho
+        if not self.attacking:
+            return
+        whip_length = 64
+        whip_width = 3
+        if self.facing_right:
+            self.attack_rect = Rect(self.rect.right, self.rect.centery - whip_width//2, whip_length, whip_width)
+        else:
+            self.attack_rect = Rect(self.rect.left - whip_length, self.rect.centery - whip_width//2, whip_length, whip_width)
+    
+    def shield(self):
+        if not self.shielding and self.shield_cooldown <= 0:
+            self.shielding = True
+            self.shield_timer = 0
+            self.emit_sound('shield', 0.7)
+    
+    def stop_shield(self):
+        if self.shielding:
+            self.shielding = False
+            self.shield_timer = 0
+    
+    def take_damage(self, amount):
+        if self.invincibility_timer <= 0 and not self.shielding:
+            self.health -= amount
+            self.invincibility_timer = self.hit_cooldown
+            self.emit_sound('hurt', 0.8)
+            return True
+        return False
+    
+    def collect_ability(self, ability_type):
+        self.collected_ability = ability_type
+        self.emit_sound('collect', 0.8)
+    
+    def use_ability(self, enemies):
+        if self.collected_ability and not self.ability_active and self.ability_cooldown <= 0:
+            ability_cost = {
+                "big_fireball": 30,
+                "energy_wave": 37,
+                "lightning": 45,
+                "slow_time": 55,
+                "energy_orbs": 55,
+                "necromancer": 70,
+                "pain_spikes": 75,
+                "superman": 100
+            }
+            
+            cost = ability_cost.get(self.collected_ability, 0)
+            
+            if self.mana >= cost:
+                self.mana -= cost
+                self.ability_active = True
+                self.ability_cooldown = 180
+                
+                # Criar efeitos visuais para a habilidade
+                if self.collected_ability == "big_fireball":
+                    self.ability_timer = 30
+                    direction = 1 if self.facing_right else -1
+                    self.ability_effects.spawn(BigFireball, self.rect.centerx, self.rect.centery, direction)
+                elif self.collected_ability == "energy_wave":
+                    self.ability_timer = 30
+                    self.ability_effects.spawn(EnergyWave, self.rect.centerx, self.rect.centery)
+                elif self.collected_ability == "lightning":
+                    self.ability_timer = 60
+                    self.ability_effects.spawn(Lightning, self.rect.centerx, self.rect.centery)
+                elif self.collected_ability == "slow_time":
+                    self.ability_timer = 600
+                    # Aplicar lentidão aos inimigos será feito no update deles
+                elif self.collected_ability == "energy_orbs":
+                    self.ability_timer = 600
+                    self.ability_effects.spawn(EnergyOrbs, self.rect.centerx, self.rect.centery)
+                elif self.collected_ability == "necromancer":
+                    self.ability_timer = 1800
+                    # A necromancia será aplicada quando inimigos morrerem
+                elif self.collected_ability == "pain_spikes":
+                    self.ability_timer = 180
+                    direction = 1 if self.facing_right else -1
+                    self.ability_effects.spawn(PainSpikes, self.rect.centerx, self.rect.centery, direction)
+                elif self.collected_ability == "superman":
+                    self.ability_timer = 1800
+                    self.laser_active = False
+                
+                self.emit_sound('ability', 0.8)
+                return True
+        return False
+
+class Platform:
+    def __init__(self, x, y, width, height, is_ground=False):
+        self.rect = Rect(x, y, width, height)
+        self.is_ground = is_ground
+
+class Hazard:
+    def __init__(self, x, y, width, height, hazard_type="spikes"):
+        self.rect = Rect(x, y, width, height)
+        self.type = hazard_type
+
+class Enemy:
+    def __init__(self, x, y, enemy_type, level, rng=random, projectiles=None, hitboxes=None):
+        # rng é o gerador da partida (World.rng); o padrão é o módulo random
+        self.rng = rng
+        self.rect = Rect(x, y, 32, 32)
+        self.type = enemy_type
+        self.level = level
+        self.direction = 1
+        self.velocity_y = 0
+        self.gravity = 0.8
+        self.is_jumping = False
+        self.animation_frame = 0
+        self.animation_timer = 0
+        self.attack_cooldown = 0
+        self.aggro = False
+        self.aggro_timer = 0
+        # Tiros vão para o pool compartilhado do World (ver projectiles.py)
+        self.projectiles = projectiles if projectiles is not None else ProjectilePool()
+        self.hitboxes = hitboxes if hitboxes is not None else HitboxSystem()
+        self.bounds = (WIDTH, HEIGHT)
+        # Morto neste tick; sai da lista do World em process_events
+        self.dead = False
+        self.necromanced = False
+        self.slowed = False
+        self.slow_timer = 0
+        
+        stat_multiplier = 1 + (level * 0.1)
+        
+        if enemy_type == 1:
+            self.color = RED
+            self.health = 30 + (level * 5)
+            self.max_health = 30 + (level * 5)
+            self.damage = int(20 * stat_multiplier)
+            self.speed = self.rng.uniform(1.0, 2.0) * stat_multiplier
+            self.aggro_range = 200
+        elif enemy_type == 2:
+            self.color = CYAN
+            self.health = 40 + (level * 5)
+            self.max_health = 40 + (level * 5)
+            self.damage = int(25 * stat_multiplier)
+            self.speed = self.rng.uniform(1.5, 2.5) * stat_multiplier
+            self.aggro_range = 250
+            self.jump_power = -12
+        elif enemy_type == 3:
+            self.color = GREEN
+            self.health = 25 + (level * 5)
+            self.max_health = 25 + (level * 5)
+            self.damage = int(15 * stat_multiplier)
+            self.speed = self.rng.uniform(2.0, 3.0) * stat_multiplier
+            self.aggro_range = 220
+        elif enemy_type == 4:
+            self.color = PURPLE
+            self.health = 35 + (level * 5)
+            self.max_health = 35 + (level * 5)
+            self.damage = int(30 * stat_multiplier)
+            self.speed = self.rng.uniform(1.0, 1.5) * stat_multiplier
+            self.aggro_range = 300
+            self.teleport_cooldown = 0
+        elif enemy_type == 5:
+            self.color = ORANGE
+            self.health = 30 + (level * 5)
+            self.max_health = 30 + (level * 5)
+            self.damage = int(15 * stat_multiplier)
+            self.speed = self.rng.uniform(1.0, 1.5) * stat_multiplier
+            self.aggro_range = 350
+            self.shoot_cooldown = 0
+        elif enemy_type == 6:
+            self.rect = Rect(x, y, 64, 64)
+            self.color = GRAY
+            self.health = 100 + (level * 10)
+            self.max_health = 100 + (level * 10)
+            self.damage = int(35 * stat_multiplier)
+            self.speed = self.rng.uniform(0.3, 0.8) * stat_multiplier
+            self.aggro_range = 180
+        elif enemy_type == 7:
+            self.color = (150, 150, 150)
+            self.health = 50 + (level * 5)
+            self.max_health = 50 + (level * 5)
+            self.damage = int(25 * stat_multiplier)
+            self.speed = self.rng.uniform(1.0, 2.0) * stat_multiplier
+            self.aggro_range = 250
+            self.current_form = 1
+            self.form_change_timer = 0
+        elif enemy_type == 8:
+            self.color = LIGHT_BLUE
+            self.health = 35 + (level * 5)
+            self.max_health = 35 + (level * 5)
+            self.damage = int(20 * stat_multiplier)
+            self.speed = self.rng.uniform(1.5, 2.5) * stat_multiplier
+            self.aggro_range = 300
+            self.flying = True
+        elif enemy_type == 9:
+            self.color = PINK
+            self.health = 40 + (level * 5)
+            self.max_health = 40 + (level * 5)
+            self.damage = int(30 * stat_multiplier)
+            self.speed = self.rng.uniform(1.0, 1.5) * stat_multiplier
+            self.aggro_range = 280
+            self.has_twin = False
+        elif enemy_type == 10:  # Boss
+            self.rect = Rect(x, y, 96, 96)
+            self.color = DARK_RED
+            self.health = 2000
+            self.max_health = 2000
+            self.damage = int(50 * stat_multiplier)
+            self.speed = self.rng.uniform(0.5, 1.0) * stat_multiplier
+            self.aggro_range = 500
+            self.boss_state = "approach"
+            self.boss_timer = 0
+            self.boss_attack_cooldown = 0
+    
+    def update(self, player, platforms):
+        if self.slowed:
+            self.slow_timer -= 1
+            if self.slow_timer <= 0:
+                self.slowed = False
+                self.speed /= 0.4
+        
+        if not hasattr(self, 'flying') or not self.flying:
+            self.velocity_y += self.gravity
+            self.check_collisions(platforms)
+        
+        player_distance = math.sqrt((self.rect.x - player.rect.x)**2 + (self.rect.y - player.rect.y)**2)
+        
+        if player_distance < self.aggro_range:
+            self.aggro = True
+            self.aggro_timer = 120
+        elif self.aggro_timer > 0:
+            self.aggro_timer -= 1
+        else:
+            self.aggro = False
+        
+        if self.aggro:
+            self.aggro_behavior(player)
+        else:
+            self.patrol_behavior()
+        
+        self.animation_timer += 1
+        if self.animation_timer >= 15:
+            self.animation_frame = (self.animation_frame + 1) % 4
+            self.animation_timer = 0
+        
+        if self.type == 10:
+            self.boss_behavior(player)
+        
+        # Dano de contato no jogador, com empurrão
+        self.hitboxes.declare(self, self.rect, self.damage, TARGET_PLAYER, knockback=20)
+    
+    def apply_slow(self):
+        if not self.slowed:
+            self.slowed = True
+            self.slow_timer = 600
+            self.speed *= 0.4
+    
+    def boss_behavior(self, player):
+        self.boss_timer += 1
+        self.boss_attack_cooldown -= 1
+        
+        if self.boss_state == "approach":
+            if self.rect.x < player.rect.x:
+                self.rect.x += self.speed
+            else:
+                self.rect.x -= self.speed
+            
+            if abs(self.rect.x - player.rect.x) < 100:
+                self.boss_state = "retreat"
+                self.boss_timer = 0
+        
+        elif self.boss_state == "retreat":
+            if self.rect.x < player.rect.x:
+                self.rect.x -= self.speed
+            else:
+                self.rect.x += self.speed
+            
+            if self.boss_timer > 60:
+                self.boss_state = "tremble"
+                self.boss_timer = 0
+        
+        elif self.boss_state == "tremble":
+            self.rect.x += self.rng.randint(-2, 2)
+            if self.boss_timer > 30:
+                self.boss_state = "shoot"
+                self.boss_timer = 0
+        
+        elif self.boss_state == "shoot":
+            if self.boss_attack_cooldown <= 0:
+                direction = 1 if self.rect.x < player.rect.x else -1
+                self.projectiles.spawn(self.rect.centerx, self.rect.centery, direction, self.damage // 2)
+                self.boss_attack_cooldown = 60
+                self.boss_state = "speed"
+                self.boss_timer = 0
+        
+        elif self.boss_state == "speed":
+            self.speed = 5
+            if self.rect.x < player.rect.x:
+                self.rect.x += self.speed
+            else:
+                self.rect.x -= self.speed
+            
+            if abs(self.rect.x - player.rect.x) < 50:
+                self.boss_state = "teleport"
+                self.boss_timer = 0
+        
+        elif self.boss_state == "teleport":
+            self.rect.x = player.rect.x - 160
+            self.boss_state = "jump"
+            self.boss_timer = 0
+        
+        elif self.boss_state == "jump":
+            if not self.is_jumping:
+                self.velocity_y = -15
+                self.is_jumping = True
+            
+            if self.rect.bottom >= player.rect.top and self.velocity_y > 0:
+                self.boss_state = "approach"
+                self.speed = self.rng.uniform(0.5, 1.0)
+                self.boss_timer = 0
+    
+    def aggro_behavior(self, player):
+        if self.type == 10:
+            return
+        
+        if self.rect.x < player.rect.x:
+            self.rect.x += self.speed
+            self.direction = 1
+        else:
+            self.rect.x -= self.speed
+            self.direction = -1
+        
+        self.aggro_special(player)
+    
+    def aggro_special(self, player):
+        # Parte do aggro que depende do tipo; o EnemyBatch só chama esta
+        if self.type == 2 and not self.is_jumping and self.rng.random() < 0.02:
+            self.velocity_y = self.jump_power
+            self.is_jumping = True
+        
+        elif self.type == 4 and self.teleport_cooldown <= 0:
+            if self.rng.random() < 0.01:
+                self.rect.x = player.rect.x - 160
+                self.teleport_cooldown = 180
+        
+        elif self.type == 5 and self.shoot_cooldown <= 0:
+            direction = 1 if self.rect.x < player.rect.x else -1
+            self.projectiles.spawn(self.rect.centerx, self.rect.centery, direction, self.damage // 2)
+            self.shoot_cooldown = 120 - (self.level * 5)
+        
+        elif self.type == 7:
+            self.form_change_timer += 1
+            if self.form_change_timer >= 300:
+                self.current_form = self.rng.randint(1, 8)
+                self.form_change_timer = 0
+        
+        elif self.type == 8:
+            if self.rect.y < player.rect.y:
+                self.rect.y += 1
+            else:
+                self.rect.y -= 1
+        
+        elif self.type == 9 and not self.has_twin:
+            self.has_twin = True
+        
+        if self.type == 4:
+            self.teleport_cooldown -= 1
+        if self.type == 5:
+            self.shoot_cooldown -= 1
+    
+    def patrol_behavior(self):
+        if self.type == 10:
+            return
+        
+        self.rect.x += self.speed * self.direction
+        
+        if self.rect.left < 0 or self.rect.right > self.bounds[0] or self.rng.random() < 0.01:
+            self.direction *= -1
+    
+    def check_collisions(self, platforms):
+        # Queda e pulo com varredura; em x os inimigos passam pelas
+        # plataformas (andando e teleportando), então só y colide
+        if move_y(self.rect, self.velocity_y, platforms):
+            if self.velocity_y > 0:
+                self.is_jumping = False
+            self.velocity_y = 0
+        
+        width, height = self.bounds
+        if self.rect.left < 0:
+            self.rect.left = 0
+            self.direction = 1
+        if self.rect.right > width:
+            self.rect.right = width
+            self.direction = -1
+        if self.rect.bottom > height and not hasattr(self, 'flying'):
+            self.rect.bottom = height
+            self.velocity_y = 0
+            self.is_jumping = False
+
+class AbilityOrb:
+    def __init__(self, x, y, ability_type):
+        self.rect = Rect(x, y, 30, 30)
+        self.type = ability_type
+        self.collected = False
+        self.animation_timer = 0
+        
+        self.colors = {
+            "big_fireball": ORANGE,
+            "energy_wave": BLUE,
+            "lightning": PURPLE,
+            "slow_time": GRAY,
+            "energy_orbs": YELLOW,
+            "necromancer": (50, 50, 50),
+            "pain_spikes": DARK_RED,
+            "superman": RED
+        }
+        
+        self.color = self.colors.get(ability_type, WHITE)
+    
+    def update(self, player):
+        self.animation_timer += 1
+        if not self.collected and player.rect.colliderect(self.rect):
+            player.collect_ability(self.type)
+            self.collected = True
+            return True
+        return False
+
+class Door:
+    def __init__(self, x, y):
+        self.rect = Rect(x, y, 50, 70)
+
+# Plataformas e hazards não mudam durante a partida: os objetos e as grades
+# espaciais de cada nível são montados uma vez e compartilhados entre Worlds.
+# O lock deixa o próximo nível ser montado numa thread (ver preload.py).
+_level_entities = {}
+_level_entities_lock = threading.Lock()
+
+def level_entities(level):
+    with _level_entities_lock:
+        entities = _level_entities.get(level)
+        if entities is None:
+            compiled = compile_level(level)
+            platforms = tuple(Platform(x, y, w, h, is_ground) for x, y, w, h, is_ground in compiled.platforms)
+            hazards = tuple(Hazard(x, y, w, h) for x, y, w, h in compiled.hazards)
+            entities = (platforms, hazards, SweepAndPrune(platforms), SweepAndPrune(hazards))
+            _level_entities[level] = entities
+        return entities
+
+class LevelBuild:
+    # Tudo que World.install_level precisa para trocar de nível. Montar um
+    # LevelBuild não mexe no World nem no RNG da partida, então pode ser feito
+    # antes da hora e fora da thread principal.
+    __slots__ = ("level", "bounds", "player_start", "platforms", "hazards", "platform_grid",
+                 "hazard_grid", "enemies", "door", "ability_orbs", "ability_choices")
+
+class World:
+    def __init__(self, level=1, seed=None, batched=False):
+        # Toda a aleatoriedade da partida sai de self.rng: com a mesma semente
+        # e os mesmos comandos por tick a partida se repete exatamente.
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.state = "playing"
+        self.player = None
+        self.enemies = []
+        self.platforms = ()
+        self.hazards = ()
+        # Largura e altura do nível atual
+        self.bounds = (WIDTH, HEIGHT)
+        # Segue o jogador a cada tick; os inimigos fora da área dela dormem
+        self.camera = Camera()
+        self.door = None
+        self.ability_orbs = []
+        self.level = level
+        self.max_level = 10
+        self.transition_timer = 0
+        self.transitioning = False
+        # Ticks da tela de transição depois da porta; 1 troca de nível no tick seguinte
+        self.transition_ticks = 60
+        # level_source(world, nível) -> LevelBuild pronto ou None
+        self.level_source = None
+        self.ability_choices = []
+        self.ticks = 0
+        # Incrementado a cada generate_level; quem guarda cache do cenário compara com ele
+        self.layout_version = 0
+        # Incrementado a cada snapshot restaurado (ver snapshot.py)
+        self.restore_version = 0
+        self.sound_events = []
+        self.platform_grid = SweepAndPrune()
+        self.hazard_grid = SweepAndPrune()
+        self.enemy_grid = SpatialGrid()
+        self.enemy_grid_dirty = False
+        # Tiros de todos os inimigos do nível
+        self.projectiles = ProjectilePool()
+        # Hitboxes declaradas no tick (jogador, efeitos e inimigos)
+        self.hitboxes = HitboxSystem()
+        # Acertos do tick, aplicados de uma vez em process_events
+        self.events = EventQueue()
+        # listener(tipo, alvo) para cada dano aplicado, morte e necromancia;
+        # só para feedback visual (ver particles.py)
+        self.combat_listener = None
+        # Motor em lote dos inimigos (enemy_batch.py, precisa do NumPy), para hordas.
+        # Importado só aqui: o NumPy sozinho custa mais que o resto da simulação
+        self.enemy_batch = None
+        if batched:
+            from .enemy_batch import EnemyBatch
+            self.enemy_batch = EnemyBatch(self.seed)
+        # Snapshot do começo do nível atual e do último checkpoint (ver snapshot.py);
+        # com checkpoint_interval 0 só o do começo do nível é tirado
+        self.level_start = None
+        self.checkpoint = None
+        self.checkpoint_interval = 0
+        
+        self.generate_level()
+    
+    def generate_level(self):
+        self.install_level(self.build_level(self.level))
+    
+    def build_level(self, level):
+        # O nível sai do template compilado e do plano de spawn em cache
+        # (ver levels.py); aqui só são criados os objetos que mudam na partida.
+        compiled = compile_level(level)
+        plan = spawn_plan(level, self.seed)
+        build = LevelBuild()
+        build.level = level
+        build.bounds = compiled.bounds
+        build.player_start = compiled.player_start
+        build.platforms, build.hazards, build.platform_grid, build.hazard_grid = level_entities(level)
+        
+        # Inimigos: os atributos sorteados no construtor vêm da semente do
+        # plano; durante o jogo eles usam o RNG da partida
+        spawn_rng = random.Random(plan.enemy_seed)
+        build.enemies = []
+        for x, y, enemy_type in plan.spawns:
+            enemy = Enemy(x, y, enemy_type, level, spawn_rng, self.projectiles, self.hitboxes)
+            enemy.rng = self.rng
+            enemy.bounds = compiled.bounds
+            build.enemies.append(enemy)
+        
+        # Porta
+        build.door = Door(*compiled.door)
+        
+        # Orbe de habilidade
+        build.ability_orbs = []
+        if compiled.orb:
+            build.ability_orbs.append(AbilityOrb(*compiled.orb))
+        
+        # Escolhas de habilidade para o boss
+        build.ability_choices = compiled.ability_choices
+        return build
+    
+    def install_level(self, build):
+        self.bounds = build.bounds
+        self.projectiles.width = build.bounds[0]
+        self.platforms = build.platforms
+        self.hazards = build.hazards
+        self.platform_grid = build.platform_grid
+        self.hazard_grid = build.hazard_grid
+        self.enemies = build.enemies
+        self.door = build.door
+        self.ability_orbs = build.ability_orbs
+        if build.ability_choices:
+            self.ability_choices = list(build.ability_choices)
+        self.projectiles.clear()
+        self.hitboxes.clear()
+        self.events.clear()
+        self.transitioning = False
+        self.layout_version += 1
+        
+        self.enemy_grid.rebuild(self.enemies)
+        self.enemy_grid_dirty = False
+        
+        # Inicializar jogador
+        start_x, start_y = build.player_start
+        if not self.player:
+            self.player = Player(start_x, start_y, self.hitboxes)
+        else:
+            self.player.rect.x = start_x
+            self.player.rect.y = start_y
+            self.player.health = self.player.max_health
+            self.player.mana = self.player.max_mana
+            
+            if self.level != 10:
+                self.player.collected_ability = None
+                self.player.ability_active = False
+        self.player.bounds = build.bounds
+        self.camera.follow(self.player.rect, *self.bounds)
+        self.level_start = self.snapshot()
+        self.checkpoint = None
+    
+    def snapshot(self):
+        # Estado da partida entre dois ticks; restore() volta para ele
+        return WorldSnapshot(self)
+    
+    def restore(self, snapshot):
+        snapshot.restore(self)
+    
+    def restart_level(self):
+        # Recomeça o nível atual como ele começou, a partir do snapshot do
+        # começo do nível: nada é sorteado nem montado de novo
+        self.restore(self.level_start)
+        self.checkpoint = None
+    
+    def restart_checkpoint(self):
+        # Volta para o último checkpoint do nível (ou para o começo dele)
+        self.restore(self.checkpoint or self.level_start)
+    
+    def next_level(self):
+        self.level += 1
+        if self.level > self.max_level:
+            self.state = "victory"
+            return
+        # Nível já montado em segundo plano, se houver (ver preload.py)
+        build = self.level_source(self, self.level) if self.level_source else None
+        self.install_level(build or self.build_level(self.level))
+    
+    def apply_input(self, command):
+        if command == "left":
+            self.player.move_left()
+        elif command == "right":
+            self.player.move_right()
+        elif command == "stop":
+            self.player.stop()
+        elif command == "jump":
+            self.player.jump()
+        elif command == "attack":
+            self.player.attack()
+        elif command == "shield":
+            self.player.shield()
+        elif command == "stop_shield":
+            self.player.stop_shield()
+        elif command == "ability":
+            self.player.use_ability(self.enemies)
+    
+    def pop_sound_events(self):
+        events = self.sound_events + self.player.sound_events
+        self.sound_events = []
+        self.player.sound_events = []
+        return events
+    
+    def query_enemies(self, rect):
+        # A grade de inimigos só é atualizada quando alguém consulta depois
+        # que eles se moveram; ticks sem efeitos nem chicote não pagam nada.
+        # A atualização é incremental: só mexe nas células de quem trocou de
+        # célula (os novos entram no fim, na mesma ordem da lista) e os mortos
+        # já saíram em remove_dead_enemies.
+        if self.enemy_grid_dirty:
+            grid = self.enemy_grid
+            for enemy in self.enemies:
+                grid.move(enemy)
+            self.enemy_grid_dirty = False
+        return self.enemy_grid.query(rect)
+    
+    def step(self, inputs=()):
+        # Avança a simulação um tick. `inputs` é uma sequência de comandos de
+        # INPUT_COMMANDS, aplicados na ordem antes da física.
+        if self.state != "playing":
+            return
+        
+        self.ticks += 1
+        
+        for command in inputs:
+            self.apply_input(command)
+        
+        if self.transitioning:
+            self.transition_timer -= 1
+            if self.transition_timer > 0:
+                return
+            self.next_level()
+            self.transitioning = False
+            if self.state != "playing":
+                return
+        
+        self.player.update(self.platform_grid, self.hazard_grid, self.enemies)
+        
+        # Verificar morte do jogador
+        if self.player.health <= 0:
+            self.state = "game_over"
+            return
+        
+        self.camera.follow(self.player.rect, *self.bounds)
+        self.update_enemies()
+        self.resolve_hits()
+        self.update_pickups()
+        
+        if self.checkpoint_interval and self.ticks % self.checkpoint_interval == 0:
+            self.save_checkpoint()
+    
+    def save_checkpoint(self):
+        # Só com o jogador inteiro e fora da porta, para não voltar para
+        # um ponto sem saída
+        player = self.player
+        if not self.transitioning and player.health > player.max_health // 2:
+            self.checkpoint = self.snapshot()
+    
+    def update_enemies(self):
+        # Atualizar inimigos
+        slow_time = self.player.ability_active and self.player.collected_ability == "slow_time"
+        # Só quem está perto da área da câmera; num nível do tamanho da tela
+        # isso é todo mundo
+        awake = self.camera.view(SLEEP_MARGIN)
+        if self.enemy_batch:
+            self.enemy_batch.update(self.enemies, self.player, self.platforms, self.hitboxes,
+                                    slow_time, self.bounds, awake)
+        else:
+            for enemy in self.enemies:
+                if not awake.colliderect(enemy.rect):
+                    continue
+                enemy.update(self.player, self.platform_grid)
+                
+                # Aplicar lentidão temporal se a habilidade estiver ativa
+                if slow_time:
+                    enemy.apply_slow()
+        
+        # Tiros dos inimigos, todos numa passada
+        self.projectiles.update(self.player, self.events)
+        
+        self.enemy_grid_dirty = True
+    
+    def resolve_hits(self):
+        # Todas as hitboxes declaradas no tick, depois que todos se moveram;
+        # cada acerto vira um evento, aplicado em process_events
+        player = self.player
+        events = self.events
+        for hitbox in self.hitboxes:
+            if hitbox.target == TARGET_ENEMIES:
+                for enemy in self.query_enemies(hitbox.rect):
+                    if hitbox.hit_test is None or hitbox.hit_test(enemy):
+                        events.damage(enemy, hitbox.damage)
+            elif not player.invincibility_timer and hitbox.rect.colliderect(player.rect):
+                events.damage(player, hitbox.damage, hitbox.rect.x, hitbox.knockback)
+        self.hitboxes.expire()
+        self.process_events()
+    
+    def process_events(self):
+        # Dano, morte e necromancia do tick, na ordem dos acertos (ver events.py)
+        player = self.player
+        necromancy = player.ability_active and player.collected_ability == "necromancer"
+        listener = self.combat_listener
+        deaths = False
+        for event in self.events.drain():
+            target = event.target
+            if event.kind == DAMAGE:
+                if target is player:
+                    if player.take_damage(event.amount):
+                        if event.knockback:
+                            if event.source_x < player.rect.x:
+                                player.rect.x += event.knockback
+                            else:
+                                player.rect.x -= event.knockback
+                        if listener:
+                            listener(DAMAGE, player)
+                elif not target.dead:
+                    if listener:
+                        listener(DAMAGE, target)
+                    # Repetido no mesmo tick, toca uma vez (SOUND_COOLDOWNS)
+                    self.sound_events.append(('enemy_hurt', 0.6))
+                    target.health -= event.amount
+                    if target.health <= 0:
+                        if necromancy:
+                            # Revive na hora: os próximos acertos do tick já
+                            # pegam o inimigo com a vida nova
+                            target.necromanced = True
+                            target.health = target.max_health // 2
+                            self.events.push(NECROMANCY, target)
+                        else:
+                            target.dead = True
+                            self.events.push(DEATH, target)
+            elif event.kind == DEATH:
+                deaths = True
+                if listener:
+                    listener(DEATH, target)
+            elif event.kind == NECROMANCY:
+                player.necromanced_enemies.append(target)
+                if listener:
+                    listener(NECROMANCY, target)
+        if deaths:
+            self.remove_dead_enemies()
+    
+    def remove_dead_enemies(self):
+        # Compacta a lista mantendo a ordem: uma passada para todas as mortes
+        # do tick, em vez de um list.remove por inimigo
+        enemies = self.enemies
+        grid = self.enemy_grid
+        kept = 0
+        for enemy in enemies:
+            if enemy.dead:
+                grid.remove(enemy)
+            else:
+                enemies[kept] = enemy
+                kept += 1
+        del enemies[kept:]
+        self.enemy_grid_dirty = True
+    
+    def update_pickups(self):
+        # Verificar orbes de habilidade
+        for orb in self.ability_orbs[:]:
+            if orb.update(self.player):
+                self.ability_orbs.remove(orb)
+        
+        # Verificar porta
+        if self.door and self.player.rect.colliderect(self.door.rect):
+            self.transitioning = True
+            self.transition_timer = self.transition_ticks
+            self.sound_events.append(('door', 0.8))
@@ -0,0 +1,18 @@
+from panteão.balance import play_level
+
+# Sementes fixas: as partidas são determinísticas (ver balance.py)
+SEEDS = range(1234, 1244)
+MAX_TICKS = 60 * 120
+
+def test_door_policy_reaches_door_on_level_2():
+    # Nível 2 é o primeiro com o zigue-zague de plataformas até a porta
+    results = [play_level(2, seed, "door", MAX_TICKS) for seed in SEEDS]
+    door_rate = sum(result["door"] for result in results) / len(results)
+    assert door_rate > 0
+
+def test_timeout_counts_as_survival_but_not_door():
+    # Parada antes de chegar na porta, com o jogador vivo
+    result = play_level(2, SEEDS[0], "door", 10)
+    assert result["timeout"]
+    assert result["survived"]
+    assert not result["door"]
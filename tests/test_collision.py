@@ -0,0 +1,33 @@
+import pytest
+
+from panteão.collision import move_y
+from panteão.spatial import Rect, SweepAndPrune
+from panteão.world import World, Platform
+
+# Plataforma de 20px de espessura; as velocidades passam dela num tick
+PLATFORM = (350, 350, 150, 20)
+
+@pytest.mark.parametrize("dy", [30, 60, 120])
+def test_fast_fall_stops_on_top(dy):
+    platform = Platform(*PLATFORM)
+    rect = Rect(400, 300, 32, 32)
+    assert move_y(rect, dy, SweepAndPrune([platform])) is platform
+    assert rect.bottom == platform.rect.top
+
+def test_fast_jump_stops_under_platform():
+    platform = Platform(*PLATFORM)
+    rect = Rect(400, 380, 32, 32)
+    assert move_y(rect, -60, SweepAndPrune([platform])) is platform
+    assert rect.top == platform.rect.bottom
+
+def test_player_falling_fast_lands_on_platform():
+    # Nível 1 tem a mesma plataforma em (350, 350)
+    world = World(level=1, seed=1)
+    player = world.player
+    player.rect.x = 400
+    player.rect.y = 300
+    player.velocity_y = 120
+    player.check_collisions(world.platform_grid, world.hazard_grid)
+    assert player.rect.bottom == 350
+    assert player.velocity_y == 0
+    assert not player.is_jumping
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from panteão import levels
+from panteão.constants import WIDTH, HEIGHT
+from panteão.world import World
+
+# Nível de teste duas vezes maior que a janela nos dois eixos
+WIDE_LEVEL = 99
+WIDE_SIZE = (WIDTH * 2, HEIGHT * 2)
+
+@pytest.fixture
+def wide_level(monkeypatch):
+    monkeypatch.setitem(levels.TEMPLATES, WIDE_LEVEL, {
+        "size": WIDE_SIZE,
+        "platforms": [(300, WIDE_SIZE[1] - 150, 200, 20)],
+        "enemies": [(WIDE_SIZE[0] - 100, WIDE_SIZE[1] - 82, 1)],
+        "door": (WIDE_SIZE[0] - 60, 0),
+    })
+    monkeypatch.setattr(levels, "_compiled", {})
+    return WIDE_LEVEL
+
+def test_wide_level_puts_player_on_its_ground(wide_level):
+    world = World(level=wide_level, seed=1)
+    assert world.bounds == WIDE_SIZE
+    for _ in range(30):
+        world.step()
+    assert world.player.rect.bottom == WIDE_SIZE[1] - levels.GROUND_HEIGHT
+
+def test_camera_follows_player_across_wide_level(wide_level):
+    world = World(level=wide_level, seed=1)
+    # A câmera começa no canto de baixo, onde está o jogador
+    assert world.camera.y == WIDE_SIZE[1] - HEIGHT
+    world.step(["right"])
+    for _ in range(300):
+        world.step()
+    player = world.player
+    assert player.rect.x > WIDTH
+    assert player.rect.right <= WIDE_SIZE[0]
+    assert 0 < world.camera.x <= WIDE_SIZE[0] - WIDTH
+    assert world.camera.view().colliderect(player.rect)
+
+def test_clouds_cover_wide_level():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame = pytest.importorskip("pygame")
+    from pgzero.screen import Screen
+    from panteão import render
+    surface = pygame.Surface(WIDE_SIZE)
+    render.draw_background(2, Screen(surface), WIDE_SIZE)
+    # Nuvem i=10, depois da primeira tela: (1200, 100)
+    assert tuple(surface.get_at((1200, 100)))[:3] == render.WHITE
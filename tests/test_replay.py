@@ -0,0 +1,44 @@
+import json
+import random
+
+import pytest
+
+from panteão.replay import REPLAY_VERSION, Replay, ReplayRecorder
+from panteão.world import World, INPUT_COMMANDS
+
+SEED = 4321
+TICKS = 600
+
+def final_state(world):
+    player = world.player
+    return (world.ticks, world.state, world.level, player.rect.x, player.rect.y, player.health,
+            [(enemy.rect.x, enemy.rect.y, enemy.health) for enemy in world.enemies],
+            world.rng.getstate())
+
+def record(path):
+    # Partida gravada como no jogo: record antes de cada World.step
+    world = World(level=2, seed=SEED)
+    recorder = ReplayRecorder(SEED, level=2, transition_ticks=world.transition_ticks)
+    rng = random.Random(SEED)
+    while world.state == "playing" and world.ticks < TICKS:
+        inputs = [rng.choice(INPUT_COMMANDS)] if rng.random() < 0.2 else []
+        recorder.record(world.ticks, inputs)
+        world.step(inputs)
+        world.pop_sound_events()
+    recorder.save(path)
+    return world
+
+def test_replay_round_trip(tmp_path):
+    path = tmp_path / "replay.json"
+    world = record(path)
+    replayed = Replay.load(path).play()
+    assert final_state(replayed) == final_state(world)
+
+def test_replay_with_other_version_is_rejected(tmp_path):
+    path = tmp_path / "replay.json"
+    record(path)
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    data["version"] = REPLAY_VERSION - 1
+    with pytest.raises(ValueError):
+        Replay.from_dict(data)
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from panteão import enemy_batch
+from panteão.world import World, INPUT_COMMANDS
+
+TICKS = 300
+
+def commands(rng):
+    # Um comando sorteado a cada 7 ticks, do mesmo RNG nas duas passadas
+    return [[rng.choice(INPUT_COMMANDS)] if tick % 7 == 0 else () for tick in range(TICKS)]
+
+def play(world, inputs):
+    for tick_inputs in inputs:
+        world.step(tick_inputs)
+        world.pop_sound_events()
+
+def state(world):
+    player = world.player
+    enemies = [(enemy.type, enemy.rect.x, enemy.rect.y, enemy.health, enemy.necromanced)
+               for enemy in world.enemies]
+    batch = world.enemy_batch.random.bit_generator.state if world.enemy_batch else None
+    return {
+        "ticks": world.ticks,
+        "state": world.state,
+        "player": (player.rect.x, player.rect.y, player.velocity_y, player.health, player.mana,
+                   len(player.ability_effects)),
+        "enemies": enemies,
+        "projectiles": world.projectiles.count,
+        "rng": world.rng.getstate(),
+        "batch_rng": batch,
+    }
+
+@pytest.mark.parametrize("batched", [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not enemy_batch.available, reason="precisa do NumPy")),
+])
+def test_restore_replays_the_same_ticks(batched):
+    world = World(level=5, seed=77, batched=batched)
+    world.player.collected_ability = "pain_spikes"
+    world.player.health = 10**6
+    rng = random.Random(5)
+    play(world, commands(rng))
+    
+    snapshot = world.snapshot()
+    inputs = commands(rng)
+    play(world, inputs)
+    expected = state(world)
+    
+    world.restore(snapshot)
+    play(world, inputs)
+    assert state(world) == expected